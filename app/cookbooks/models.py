@@ -6,7 +6,6 @@ Cookbooks 모듈 모델
 
 from datetime import datetime
 from decimal import Decimal
-from uuid import uuid4
 
 from sqlalchemy import (
     DECIMAL,
@@ -22,7 +21,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.infra.database import Base, TimestampMixin
+from app.infra.database import Base, TimestampMixin, generate_uuid_str
 
 
 class Cookbook(Base, TimestampMixin):
@@ -40,7 +39,7 @@ class Cookbook(Base, TimestampMixin):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=generate_uuid_str,
     )
     user_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -107,7 +106,7 @@ class SavedRecipe(Base, TimestampMixin):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=generate_uuid_str,
     )
     cookbook_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -5,7 +5,6 @@ Cookbooks 모듈 서비스
 """
 
 import logging
-from uuid import uuid4
 
 from sqlalchemy import func, select, update
 from sqlalchemy.exc import IntegrityError
@@ -19,6 +18,7 @@ from app.cookbooks.exceptions import (
     SavedRecipeNotFoundError,
 )
 from app.cookbooks.models import Cookbook, SavedRecipe
+from app.infra.database import generate_uuid_str
 from app.recipes.models import Recipe
 from app.cookbooks.schemas import (
     CookbookCreateRequest,
@@ -68,7 +68,7 @@ class CookbookService:
 
         # 기본 레시피북 생성
         new_cookbook = Cookbook(
-            id=str(uuid4()),
+            id=generate_uuid_str(),
             user_id=user_id,
             name="내 레시피북",
             is_default=True,
@@ -108,7 +108,7 @@ class CookbookService:
 
         # 새 레시피북 생성
         cookbook = Cookbook(
-            id=str(uuid4()),
+            id=generate_uuid_str(),
             user_id=user_id,
             name=data.name,
             description=data.description,
@@ -437,7 +437,7 @@ class SavedRecipeService:
 
         # 저장된 레시피 생성
         saved_recipe = SavedRecipe(
-            id=str(uuid4()),
+            id=generate_uuid_str(),
             cookbook_id=cookbook.id,
             original_recipe_id=data.recipe_id,
             memo=data.memo,
@@ -31,7 +31,7 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
 
     # CORS
-    CORS_ORIGINS: list[str] = ["*"]
+    CORS_ORIGINS: frozenset[str] = frozenset({"*"})  # 요청마다 멤버십 검사 → 해시 조회
 
     # ==========================================================================
     # 데이터베이스 설정 (단일 PostgreSQL, 스키마 분리)
@@ -70,7 +70,9 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_PASSWORD: SecretStr = SecretStr("")
     REDIS_DB: int = 0
-    REDIS_MAX_CONNECTIONS: int = 50
+    # 비동기 워커 1개 기준: 짧은 GET/SET 위주라 작은 풀로 충분 (동시성은 파이프라인으로 확보)
+    REDIS_MAX_CONNECTIONS: int = 10
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30  # 초
 
     @property
     def redis_url(self) -> str:
@@ -92,6 +94,8 @@ class Settings(BaseSettings):
     # 보안 설정
     # ==========================================================================
     PASSWORD_MIN_LENGTH: int = 8
+    BCRYPT_ROUNDS: int = 12  # 변경 시 기존 해시는 다음 로그인 때 재해싱
+    PASSWORD_HASH_MAX_WORKERS: int = 4  # bcrypt 연산 전용 스레드 수 (이벤트 루프 밖에서 실행)
     LOGIN_FAILURE_LIMIT: int = 5
     ACCOUNT_LOCK_MINUTES: int = 15
 
@@ -114,6 +118,8 @@ class Settings(BaseSettings):
     NAVER_REDIRECT_URI: str = "http://localhost:3000/auth/callback/naver"
 
     OAUTH_STATE_EXPIRE_SECONDS: int = 600
+    OAUTH_HTTP_TIMEOUT: float = 10.0  # 초
+    OAUTH_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 32
 
     # ==========================================================================
     # 캐시 설정
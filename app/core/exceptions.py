@@ -305,13 +305,20 @@ class RecipeNotFoundError(ProblemDetail):
 # ==========================================================================
 
 
+# 자주 발생하는 HTTP 상태 코드의 type URI (예외마다 문자열을 만들지 않도록 미리 계산)
+_HTTP_ERROR_TYPE_URIS: dict[int, str] = {
+    code: f"{ERROR_BASE_URI}/http/{code}"
+    for code in (400, 401, 403, 404, 405, 409, 422, 429, 500)
+}
+
+
 async def problem_detail_exception_handler(
     request: Request, exc: ProblemDetail
 ) -> JSONResponse:
     """ProblemDetail 예외를 JSON 응답으로 변환"""
     response_data = exc.to_dict()
     if exc.instance is None:
-        response_data["instance"] = str(request.url.path)
+        response_data["instance"] = request.url.path
     return JSONResponse(
         status_code=exc.status,
         content=response_data,
@@ -323,14 +330,18 @@ async def http_exception_handler(
     request: Request, exc: HTTPException
 ) -> JSONResponse:
     """HTTPException을 RFC 7807 형식으로 변환"""
+    status_code = exc.status_code
+    type_uri = _HTTP_ERROR_TYPE_URIS.get(status_code)
+    if type_uri is None:
+        type_uri = f"{ERROR_BASE_URI}/http/{status_code}"
     return JSONResponse(
-        status_code=exc.status_code,
+        status_code=status_code,
         content={
-            "type": f"{ERROR_BASE_URI}/http/{exc.status_code}",
+            "type": type_uri,
             "title": "HTTP Error",
-            "status": exc.status_code,
+            "status": status_code,
             "detail": exc.detail,
-            "instance": str(request.url.path),
+            "instance": request.url.path,
         },
         media_type="application/problem+json",
     )
@@ -7,6 +7,8 @@ structlog를 사용한 JSON 로깅을 설정합니다.
 
 import logging
 import sys
+import time
+from functools import lru_cache
 from typing import Any
 
 import structlog
@@ -27,6 +29,40 @@ SENSITIVE_KEYWORDS: set[str] = {
 }
 
 
+@lru_cache(maxsize=1024)
+def _is_sensitive_key(key: str) -> bool:
+    """로그 키가 민감 정보 키워드를 포함하는지 확인 (키 이름별 결과 캐시)"""
+    lowered = key.lower()
+    return any(s in lowered for s in SENSITIVE_KEYWORDS)
+
+
+# 초 단위 타임스탬프 문자열 캐시 (같은 초 안의 로그는 포맷 결과 재사용)
+_last_second: int = -1
+_last_second_str: str = ""
+
+
+def _utc_timestamp_processor(
+    logger: Any,
+    method_name: str,
+    event_dict: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    structlog 프로세서: UTC ISO 8601 타임스탬프 추가
+
+    TimeStamper(fmt="iso")와 같은 형식을 만들되, 날짜/시각 부분은
+    초가 바뀔 때만 다시 포맷합니다.
+    """
+    global _last_second, _last_second_str
+
+    now = time.time()
+    second = int(now)
+    if second != _last_second:
+        _last_second_str = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _last_second = second
+    event_dict["timestamp"] = f"{_last_second_str}.{int((now - second) * 1e6):06d}Z"
+    return event_dict
+
+
 def _mask_sensitive_processor(
     logger: Any,
     method_name: str,
@@ -37,11 +73,12 @@ def _mask_sensitive_processor(
 
     로그 이벤트에서 민감한 키를 자동으로 마스킹합니다.
     """
-    for key in list(event_dict.keys()):
-        if any(s in key.lower() for s in SENSITIVE_KEYWORDS):
+    # 기존 키의 값만 교체하므로 키 목록을 복사하지 않고 순회합니다.
+    for key, value in event_dict.items():
+        if _is_sensitive_key(key):
             event_dict[key] = "***MASKED***"
-        elif isinstance(event_dict[key], dict):
-            event_dict[key] = mask_sensitive_data(event_dict[key])
+        elif isinstance(value, dict):
+            event_dict[key] = mask_sensitive_data(value)
     return event_dict
 
 
@@ -67,7 +104,7 @@ def setup_logging(
     shared_processors: list[Any] = [
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
+        _utc_timestamp_processor,
         structlog.processors.StackInfoRenderer(),
     ]
 
@@ -4,32 +4,134 @@
 비밀번호 해싱, JWT 토큰 생성/검증을 담당합니다.
 """
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+import hashlib
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Any
 
 import bcrypt
-from jose import JWTError, jwt
+import jwt
+from jwt.exceptions import PyJWTError
 
 from app.core.config import settings
 
+# 핫 패스에서 속성 조회를 줄이기 위해 미리 바인딩
+_jwt_encode = jwt.encode
+_jwt_decode = jwt.decode
+
+# 프로세스 수명 동안 바뀌지 않는 JWT 설정 (호출마다 settings를 읽지 않도록 고정)
+_JWT_KEY = settings.JWT_SECRET_KEY
+_JWT_ALGORITHM = settings.JWT_ALGORITHM
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+_ACCESS_TOKEN_TTL_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TOKEN_TTL_SECONDS = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+
+
+# bcrypt는 입력의 앞 72바이트만 사용합니다. bcrypt>=5는 초과 입력에 ValueError를
+# 내므로, 4.x 이하에서 만든 기존 해시와 같은 결과가 나오도록 직접 잘라서 전달합니다.
+_BCRYPT_MAX_PASSWORD_BYTES = 72
+
 
 def hash_password(password: str) -> str:
     """비밀번호를 bcrypt로 해싱"""
-    password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
+    password_bytes = password.encode("utf-8")[:_BCRYPT_MAX_PASSWORD_BYTES]
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode("utf-8")
 
 
+# bcrypt 전용 스레드 풀 (bcrypt는 GIL을 해제하므로 스레드로 병렬 실행 가능)
+# 동시 해싱 수를 제한해 로그인/가입 폭주 시에도 이벤트 루프와 다른 요청을 보호합니다.
+_password_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+    thread_name_prefix="password-hash",
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호 해싱 (이벤트 루프를 막지 않도록 전용 스레드 풀에서 실행)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_hash_executor, hash_password, password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """저장된 해시가 현재 정책(알고리즘 식별자, cost)과 다른지 확인
+
+    bcrypt 해시 형식: $2b$<cost>$<salt+hash>
+    """
+    if not hashed_password.startswith("$2b$"):
+        return True
+    try:
+        cost = int(hashed_password[4:6])
+    except ValueError:
+        return True
+    return cost != settings.BCRYPT_ROUNDS
+
+
+# 최근 비밀번호 검증 결과 캐시 (평문+해시 쌍의 keyed BLAKE2b 다이제스트 → 결과)
+_VERIFY_CACHE_MAX_SIZE = 1024
+_verify_cache: OrderedDict[bytes, bool] = OrderedDict()
+_verify_cache_lock = threading.Lock()
+# 캐시는 프로세스 내에서만 쓰이므로 키도 프로세스마다 새로 생성 (다른 비밀값과 분리)
+_VERIFY_CACHE_HASH_KEY = secrets.token_bytes(32)
+
+
+def _verify_cache_key(password_bytes: bytes, hashed_bytes: bytes) -> bytes:
+    """검증 캐시 키 생성 (평문을 메모리에 남기지 않도록 비밀 키로 해싱)"""
+    return hashlib.blake2b(
+        password_bytes + b"|" + hashed_bytes,
+        key=_VERIFY_CACHE_HASH_KEY,
+        digest_size=16,
+    ).digest()
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """비밀번호 검증"""
+    """비밀번호 검증
+
+    같은 평문+해시 쌍의 최근 결과는 캐시에서 반환해 bcrypt 연산을 생략합니다.
+    실패(False) 결과도 의도적으로 캐시합니다. 같은 틀린 비밀번호의 반복 시도가
+    매번 bcrypt 비용을 치르지 않게 하기 위함이며, 캐시 키가 평문+해시 쌍이므로
+    올바른 비밀번호나 재해싱으로 바뀐 해시의 검증에는 영향을 주지 않습니다.
+    """
     try:
-        password_bytes = plain_password.encode("utf-8")
+        password_bytes = plain_password.encode("utf-8")[:_BCRYPT_MAX_PASSWORD_BYTES]
         hashed_bytes = hashed_password.encode("utf-8")
-        return bcrypt.checkpw(password_bytes, hashed_bytes)
+        cache_key = _verify_cache_key(password_bytes, hashed_bytes)
+
+        with _verify_cache_lock:
+            cached = _verify_cache.get(cache_key)
+            if cached is not None:
+                _verify_cache.move_to_end(cache_key)
+                return cached
+
+        result = bcrypt.checkpw(password_bytes, hashed_bytes)
     except Exception:
         return False
 
+    with _verify_cache_lock:
+        _verify_cache[cache_key] = result
+        if len(_verify_cache) > _VERIFY_CACHE_MAX_SIZE:
+            _verify_cache.popitem(last=False)
+    return result
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (해싱과 같은 bcrypt 전용 스레드 풀에서 실행)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_hash_executor, verify_password, plain_password, hashed_password
+    )
+
+
+def new_jti() -> str:
+    """JWT ID 생성 (16바이트 난수의 base64url, 22자)"""
+    return secrets.token_urlsafe(16)
+
 
 def create_access_token(
     subject: str,
@@ -37,27 +139,24 @@ def create_access_token(
     additional_claims: dict[str, Any] | None = None,
 ) -> str:
     """액세스 토큰 생성"""
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+    now = int(time.time())
+    ttl = int(expires_delta.total_seconds()) if expires_delta else _ACCESS_TOKEN_TTL_SECONDS
 
+    # exp/iat는 JWT 라이브러리의 datetime 변환을 거치지 않도록 epoch 초로 직접 기록
     to_encode: dict[str, Any] = {
         "sub": subject,
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + ttl,
+        "iat": now,
         "type": "access",
     }
 
     if additional_claims:
         to_encode.update(additional_claims)
 
-    return jwt.encode(
+    return _jwt_encode(
         to_encode,
-        settings.JWT_SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM,
+        _JWT_KEY,
+        algorithm=_JWT_ALGORITHM,
     )
 
 
@@ -67,40 +166,62 @@ def create_refresh_token(
     expires_delta: timedelta | None = None,
 ) -> str:
     """리프레시 토큰 생성 (JTI로 추적)"""
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-        )
+    now = int(time.time())
+    ttl = int(expires_delta.total_seconds()) if expires_delta else _REFRESH_TOKEN_TTL_SECONDS
 
     to_encode: dict[str, Any] = {
         "sub": subject,
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + ttl,
+        "iat": now,
         "type": "refresh",
         "jti": jti,
     }
 
-    return jwt.encode(
+    return _jwt_encode(
         to_encode,
-        settings.JWT_SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM,
+        _JWT_KEY,
+        algorithm=_JWT_ALGORITHM,
     )
 
 
+# 검증된 JWT 캐시 (토큰 문자열 → (만료 시각, 페이로드))
+_TOKEN_CACHE_MAX_SIZE = 4096
+_token_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
 def decode_token(token: str) -> dict[str, Any] | None:
-    """JWT 토큰 디코드 및 검증"""
+    """JWT 토큰 디코드 및 검증
+
+    서명 검증을 통과한 토큰은 만료 전까지 캐시하여 반복 검증을 생략합니다.
+    토큰 문자열 자체가 페이로드에 대한 서명이므로 그대로 캐시 키로 사용합니다.
+    """
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+        if cached is not None:
+            expires_at, payload = cached
+            if expires_at > time.time():
+                _token_cache.move_to_end(token)
+                return dict(payload)
+            del _token_cache[token]
+
     try:
-        payload = jwt.decode(
+        payload = _jwt_decode(
             token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
+            _JWT_KEY,
+            algorithms=_JWT_ALGORITHMS,
         )
-        return payload
-    except JWTError:
+    except PyJWTError:
         return None
 
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        with _token_cache_lock:
+            _token_cache[token] = (float(exp), dict(payload))
+            if len(_token_cache) > _TOKEN_CACHE_MAX_SIZE:
+                _token_cache.popitem(last=False)
+    return payload
+
 
 def verify_access_token(token: str) -> dict[str, Any] | None:
     """액세스 토큰 검증"""
@@ -4,6 +4,7 @@
 SQLAlchemy 비동기 엔진 및 세션 팩토리를 제공합니다.
 """
 
+import os
 from collections.abc import AsyncGenerator
 from datetime import datetime
 
@@ -19,6 +20,19 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from app.core.config import settings
 
 
+def generate_uuid_str() -> str:
+    """UUID v4 문자열 생성 (기본 키 기본값용)
+
+    uuid.UUID 객체를 거치지 않고 난수 바이트에 버전/변형 비트를 직접 설정해
+    표준 8-4-4-4-12 형식 문자열을 만듭니다.
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 class Base(DeclarativeBase):
     """SQLAlchemy 모델 베이스 클래스"""
 
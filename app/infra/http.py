@@ -0,0 +1,34 @@
+"""
+HTTP 클라이언트 관리
+
+외부 API(OAuth 제공자 등) 호출용 공유 httpx 클라이언트를 제공합니다.
+요청마다 클라이언트를 만들지 않고 keep-alive 연결을 재사용합니다.
+"""
+
+import httpx
+
+from app.core.config import settings
+
+# 전역 HTTP 클라이언트 (프로세스 내 연결 풀 공유)
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """공유 HTTP 클라이언트 생성 또는 반환"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.OAUTH_HTTP_TIMEOUT),
+            limits=httpx.Limits(
+                max_keepalive_connections=settings.OAUTH_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """HTTP 클라이언트 종료"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -4,6 +4,7 @@ Redis 클라이언트 관리
 연결 풀 기반 Redis 클라이언트를 제공합니다.
 """
 
+import json
 from typing import Any
 
 import redis.asyncio as redis
@@ -14,6 +15,7 @@ from app.core.config import settings
 # 전역 연결 풀 및 클라이언트
 _pool: ConnectionPool | None = None
 _client: redis.Redis | None = None
+_redis_client: "RedisClient | None" = None
 
 
 async def get_redis_pool() -> ConnectionPool:
@@ -24,6 +26,9 @@ async def get_redis_pool() -> ConnectionPool:
             settings.redis_url,
             max_connections=settings.REDIS_MAX_CONNECTIONS,
             decode_responses=True,
+            protocol=3,  # RESP3: 타입 있는 응답 (hiredis 설치 시 C 파서 자동 사용)
+            socket_keepalive=True,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
         )
     return _pool
 
@@ -39,7 +44,8 @@ async def get_redis() -> redis.Redis:
 
 async def close_redis() -> None:
     """Redis 연결 종료"""
-    global _client, _pool
+    global _client, _pool, _redis_client
+    _redis_client = None
     if _client is not None:
         await _client.aclose()
         _client = None
@@ -54,6 +60,17 @@ class RedisClient:
     def __init__(self, client: redis.Redis):
         self._client = client
 
+        # 단순 위임 연산은 하위 클라이언트 메서드를 직접 바인딩 (래퍼 호출 프레임 제거)
+        self.delete = client.delete  # 키 삭제
+        self.incr = client.incr  # 값 증가
+        self.expire = client.expire  # 키 만료 시간 설정
+        self.ttl = client.ttl  # 키의 남은 수명 조회
+        self.keys = client.keys  # 패턴과 일치하는 키 목록 조회
+        self.setex = client.setex  # 만료 시간과 함께 키 설정
+        self.hget = client.hget  # 해시 필드 조회
+        self.hgetall = client.hgetall  # 해시의 모든 필드 조회
+        self.hdel = client.hdel  # 해시 필드 삭제
+
     # ==========================================================================
     # 기본 문자열 연산
     # ==========================================================================
@@ -80,8 +97,6 @@ class RedisClient:
             ex: 만료 시간 (초 단위)
             ttl: 만료 시간 (초 단위, ex의 별칭)
         """
-        import json
-
         expire = ex or ttl
         # dict나 list인 경우 JSON 직렬화
         if isinstance(value, (dict, list)):
@@ -95,8 +110,6 @@ class RedisClient:
             key: 키 이름
             parse_json: True일 경우 JSON 문자열을 자동으로 파싱
         """
-        import json
-
         value = await self._client.get(key)
         if value is None:
             return None
@@ -109,34 +122,10 @@ class RedisClient:
 
         return value
 
-    async def delete(self, key: str) -> int:
-        """키 삭제"""
-        return await self._client.delete(key)
-
     async def exists(self, key: str) -> bool:
         """키 존재 여부 확인"""
         return bool(await self._client.exists(key))
 
-    async def incr(self, key: str) -> int:
-        """값 증가"""
-        return await self._client.incr(key)
-
-    async def expire(self, key: str, seconds: int) -> bool:
-        """키 만료 시간 설정"""
-        return await self._client.expire(key, seconds)
-
-    async def ttl(self, key: str) -> int:
-        """키의 남은 수명 조회"""
-        return await self._client.ttl(key)
-
-    async def keys(self, pattern: str) -> list[str]:
-        """패턴과 일치하는 키 목록 조회"""
-        return await self._client.keys(pattern)
-
-    async def setex(self, key: str, seconds: int, value: str) -> bool:
-        """만료 시간과 함께 키 설정"""
-        return await self._client.setex(key, seconds, value)
-
     # ==========================================================================
     # 해시 연산
     # ==========================================================================
@@ -145,18 +134,6 @@ class RedisClient:
         """해시 필드 설정"""
         return await self._client.hset(name, mapping=mapping)
 
-    async def hget(self, name: str, key: str) -> str | None:
-        """해시 필드 조회"""
-        return await self._client.hget(name, key)
-
-    async def hgetall(self, name: str) -> dict[str, str]:
-        """해시의 모든 필드 조회"""
-        return await self._client.hgetall(name)
-
-    async def hdel(self, name: str, *keys: str) -> int:
-        """해시 필드 삭제"""
-        return await self._client.hdel(name, *keys)
-
     # ==========================================================================
     # JSON 연산 (편의 메서드)
     # ==========================================================================
@@ -168,14 +145,10 @@ class RedisClient:
         ex: int | None = None,
     ) -> bool:
         """JSON 객체 저장"""
-        import json
-
         return await self.set(key, json.dumps(value, ensure_ascii=False), ex=ex)
 
     async def get_json(self, key: str) -> dict[str, Any] | None:
         """JSON 객체 조회"""
-        import json
-
         value = await self.get(key)
         if value is None:
             return None
@@ -186,9 +159,12 @@ class RedisClient:
 
 
 async def get_redis_client() -> RedisClient:
-    """RedisClient 인스턴스 반환"""
-    client = await get_redis()
-    return RedisClient(client)
+    """RedisClient 싱글톤 인스턴스 반환"""
+    global _redis_client
+    if _redis_client is None:
+        client = await get_redis()
+        _redis_client = RedisClient(client)
+    return _redis_client
 
 
 # 캐시용 별칭
@@ -9,6 +9,7 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 
 from app import __version__
@@ -22,6 +23,7 @@ from app.core import (
 )
 from app.core.exceptions import register_exception_handlers
 from app.infra.database import engine
+from app.infra.http import close_http_client
 from app.infra.redis import get_redis_client
 
 # 로깅 설정
@@ -33,6 +35,10 @@ setup_logging(
 
 logger = get_logger(__name__)
 
+# CORS 허용 메서드 (와일드카드 대신 API가 실제 사용하는 값만 명시)
+# 요청 헤더는 조건부 요청(If-None-Match) 등 클라이언트 헤더를 막지 않도록 전체 허용
+CORS_ALLOW_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -47,6 +53,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # 종료 시 정리
     logger.info("Shutting down Naecipe Backend")
+    await close_http_client()
     await engine.dispose()
 
 
@@ -57,6 +64,7 @@ def create_app() -> FastAPI:
         description="AI 기반 맞춤형 레시피 보정 서비스",
         version=__version__,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs" if settings.DEBUG else None,
         redoc_url="/redoc" if settings.DEBUG else None,
     )
@@ -66,8 +74,10 @@ def create_app() -> FastAPI:
         CORSMiddleware,
         allow_origins=settings.CORS_ORIGINS,
         allow_credentials=True,
-        allow_methods=["*"],
+        allow_methods=CORS_ALLOW_METHODS,
         allow_headers=["*"],
+        # 브라우저 JS가 조건부 요청에 쓸 수 있도록 ETag 노출
+        expose_headers=["ETag"],
     )
 
     # 예외 핸들러 등록
@@ -86,7 +96,7 @@ def _include_routers(app: FastAPI) -> None:
     """라우터 등록"""
     from app.cookbooks import router as cookbooks_router
     from app.recipes import router as recipes_router
-    from app.users import router as users_router
+    from app.users.router import router as users_router
 
     # Users 모듈 (인증, 프로필, 취향 설정, OAuth)
     app.include_router(
@@ -6,13 +6,12 @@ Recipes 모듈 모델
 
 from datetime import datetime
 from typing import TYPE_CHECKING
-from uuid import uuid4
 
 from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.infra.database import Base, TimestampMixin
+from app.infra.database import Base, TimestampMixin, generate_uuid_str
 
 
 # ==========================================================================
@@ -32,7 +31,7 @@ class Chef(Base, TimestampMixin):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=generate_uuid_str,
     )
     name: Mapped[str] = mapped_column(
         String(100),
@@ -116,7 +115,7 @@ class ChefPlatform(Base, TimestampMixin):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=generate_uuid_str,
     )
     chef_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -174,7 +173,7 @@ class Recipe(Base, TimestampMixin):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=generate_uuid_str,
     )
 
     # 요리사 참조 (nullable - 저자 불명인 경우)
@@ -324,7 +323,7 @@ class RecipeIngredient(Base):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=generate_uuid_str,
     )
     recipe_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -398,7 +397,7 @@ class CookingStep(Base):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=generate_uuid_str,
     )
     recipe_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -466,7 +465,7 @@ class Tag(Base, TimestampMixin):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=generate_uuid_str,
     )
     name: Mapped[str] = mapped_column(
         String(50),
@@ -510,7 +509,7 @@ class RecipeTag(Base):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=generate_uuid_str,
     )
     recipe_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -2,34 +2,42 @@
 Users 모듈
 
 사용자 인증, 프로필, 취향 설정, OAuth 소셜 로그인을 담당합니다.
+
+하위 모듈은 속성을 처음 참조할 때 가져옵니다 (PEP 562).
+`app.users.models`만 필요한 코드가 라우터·서비스 스택까지 불러오지 않습니다.
 """
 
-from app.users.models import OAuthAccount, OAuthProvider, TastePreference, User, UserProfile, UserStatus
-from app.users.router import router
-from app.users.services import (
-    AuthService,
-    OAuthService,
-    PreferenceService,
-    ProfileService,
-    SessionService,
-    UserService,
-)
-
-__all__ = [
-    # Router
-    "router",
+import importlib
+from typing import Any
+
+# 공개 이름 → 정의된 하위 모듈
+# (라우터는 하위 모듈 이름과 겹치므로 `from app.users.router import router`로 가져옵니다)
+_LAZY_ATTRS: dict[str, str] = {
     # Models
-    "User",
-    "UserProfile",
-    "TastePreference",
-    "OAuthAccount",
-    "UserStatus",
-    "OAuthProvider",
+    "User": "app.users.models",
+    "UserProfile": "app.users.models",
+    "TastePreference": "app.users.models",
+    "OAuthAccount": "app.users.models",
+    "UserStatus": "app.users.models",
+    "OAuthProvider": "app.users.models",
     # Services
-    "AuthService",
-    "UserService",
-    "SessionService",
-    "ProfileService",
-    "PreferenceService",
-    "OAuthService",
-]
+    "AuthService": "app.users.services",
+    "UserService": "app.users.services",
+    "SessionService": "app.users.services",
+    "ProfileService": "app.users.services",
+    "PreferenceService": "app.users.services",
+    "OAuthService": "app.users.services",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str) -> Any:
+    """공개 이름을 하위 모듈에서 지연 로딩"""
+    module_path = _LAZY_ATTRS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
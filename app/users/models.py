@@ -5,9 +5,8 @@ User, UserProfile, TastePreference, OAuthAccount 모델을 정의합니다.
 """
 
 import enum
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
-from uuid import uuid4
 
 from sqlalchemy import (
     DateTime,
@@ -21,7 +20,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.infra.database import Base
+from app.infra.database import Base, generate_uuid_str
 
 if TYPE_CHECKING:
     pass
@@ -57,11 +56,13 @@ class User(Base):
     """사용자 인증 모델"""
 
     __tablename__ = "users"
+    # INSERT/UPDATE 시 서버 기본값(created_at, updated_at)을 RETURNING으로 함께 받아 재조회 생략
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=generate_uuid_str,
     )
     email: Mapped[str] = mapped_column(
         String(255),
@@ -124,12 +125,11 @@ class User(Base):
 
     @property
     def is_locked(self) -> bool:
-        """계정 잠금 상태 확인"""
-        if self.status != UserStatus.LOCKED:
-            return False
-        if self.locked_until is None:
-            return True
-        return datetime.now(self.locked_until.tzinfo) < self.locked_until
+        """계정 잠금 상태 확인 (locked_until은 timezone-aware UTC)"""
+        locked_until = self.locked_until
+        return self.status is UserStatus.LOCKED and (
+            locked_until is None or datetime.now(timezone.utc) < locked_until
+        )
 
 
 # ==========================================================================
@@ -141,11 +141,13 @@ class UserProfile(Base):
     """사용자 프로필 모델 - User와 1:1 관계"""
 
     __tablename__ = "user_profiles"
+    # UPDATE 시 updated_at(onupdate=now())을 RETURNING으로 함께 받아 재조회 생략
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=generate_uuid_str,
     )
     user_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -229,7 +231,7 @@ class TastePreference(Base):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=generate_uuid_str,
     )
     user_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -306,7 +308,7 @@ class OAuthAccount(Base):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=generate_uuid_str,
     )
     user_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
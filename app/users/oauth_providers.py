@@ -4,16 +4,18 @@ OAuth 제공자 설정
 카카오, 구글, 네이버 OAuth 설정을 관리합니다.
 """
 
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, field
 from typing import Any
+from urllib.parse import quote, urlencode
 
 from app.core.config import settings
 from app.users.schemas import OAuthProviderEnum
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OAuthProviderConfig:
-    """OAuth 제공자 설정"""
+    """OAuth 제공자 설정 (불변)"""
 
     provider: OAuthProviderEnum
     client_id: str
@@ -22,54 +24,76 @@ class OAuthProviderConfig:
     authorization_url: str
     token_url: str
     user_info_url: str
-    scopes: list[str]
+    scopes: tuple[str, ...]
+    scopes_str: str = field(init=False)
+    authorization_url_prefix: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        # 인증 URL 생성 시마다 join하지 않도록 공백 구분 문자열을 미리 계산
+        object.__setattr__(self, "scopes_str", " ".join(self.scopes))
+
+        # 요청마다 달라지는 state를 제외한 인가 URL을 미리 인코딩
+        params = {
+            "client_id": self.client_id,
+            "redirect_uri": self.redirect_uri,
+            "response_type": "code",
+        }
+        if self.scopes_str:
+            params["scope"] = self.scopes_str
+        object.__setattr__(
+            self,
+            "authorization_url_prefix",
+            f"{self.authorization_url}?{urlencode(params, quote_via=quote)}",
+        )
+
+
+# 제공자별 고정 엔드포인트 및 스코프 (환경 변수와 무관한 정적 값)
+_PROVIDER_ENDPOINTS: dict[OAuthProviderEnum, dict[str, Any]] = {
+    OAuthProviderEnum.KAKAO: {
+        "authorization_url": "https://kauth.kakao.com/oauth/authorize",
+        "token_url": "https://kauth.kakao.com/oauth/token",
+        "user_info_url": "https://kapi.kakao.com/v2/user/me",
+        "scopes": ("profile_nickname", "account_email"),
+    },
+    OAuthProviderEnum.GOOGLE: {
+        "authorization_url": "https://accounts.google.com/o/oauth2/v2/auth",
+        "token_url": "https://oauth2.googleapis.com/token",
+        "user_info_url": "https://www.googleapis.com/oauth2/v2/userinfo",
+        "scopes": ("openid", "email", "profile"),
+    },
+    OAuthProviderEnum.NAVER: {
+        "authorization_url": "https://nid.naver.com/oauth2.0/authorize",
+        "token_url": "https://nid.naver.com/oauth2.0/token",
+        "user_info_url": "https://openapi.naver.com/v1/nid/me",
+        "scopes": (),
+    },
+}
 
 
 class OAuthProviders:
-    """OAuth 제공자 설정 관리자"""
-
-    KAKAO = OAuthProviderConfig(
-        provider=OAuthProviderEnum.KAKAO,
-        client_id=settings.KAKAO_CLIENT_ID,
-        client_secret=settings.KAKAO_CLIENT_SECRET,
-        redirect_uri=settings.KAKAO_REDIRECT_URI,
-        authorization_url="https://kauth.kakao.com/oauth/authorize",
-        token_url="https://kauth.kakao.com/oauth/token",
-        user_info_url="https://kapi.kakao.com/v2/user/me",
-        scopes=["profile_nickname", "account_email"],
-    )
-
-    GOOGLE = OAuthProviderConfig(
-        provider=OAuthProviderEnum.GOOGLE,
-        client_id=settings.GOOGLE_CLIENT_ID,
-        client_secret=settings.GOOGLE_CLIENT_SECRET,
-        redirect_uri=settings.GOOGLE_REDIRECT_URI,
-        authorization_url="https://accounts.google.com/o/oauth2/v2/auth",
-        token_url="https://oauth2.googleapis.com/token",
-        user_info_url="https://www.googleapis.com/oauth2/v2/userinfo",
-        scopes=["openid", "email", "profile"],
-    )
-
-    NAVER = OAuthProviderConfig(
-        provider=OAuthProviderEnum.NAVER,
-        client_id=settings.NAVER_CLIENT_ID,
-        client_secret=settings.NAVER_CLIENT_SECRET,
-        redirect_uri=settings.NAVER_REDIRECT_URI,
-        authorization_url="https://nid.naver.com/oauth2.0/authorize",
-        token_url="https://nid.naver.com/oauth2.0/token",
-        user_info_url="https://openapi.naver.com/v1/nid/me",
-        scopes=[],
-    )
+    """OAuth 제공자 설정 관리자
+
+    제공자 설정은 최초 조회 시점에 생성되어 캐시됩니다.
+    OAuth를 사용하지 않는 프로세스는 기동 시 OAuth 설정을 만들지 않습니다.
+    """
+
+    @classmethod
+    @functools.cache
+    def _build(cls, provider: OAuthProviderEnum) -> OAuthProviderConfig:
+        """제공자 설정 생성 (제공자별 최초 1회)"""
+        prefix = provider.name
+        return OAuthProviderConfig(
+            provider=provider,
+            client_id=getattr(settings, f"{prefix}_CLIENT_ID"),
+            client_secret=getattr(settings, f"{prefix}_CLIENT_SECRET"),
+            redirect_uri=getattr(settings, f"{prefix}_REDIRECT_URI"),
+            **_PROVIDER_ENDPOINTS[provider],
+        )
 
     @classmethod
     def get(cls, provider: OAuthProviderEnum) -> OAuthProviderConfig:
         """제공자 설정 조회"""
-        provider_map = {
-            OAuthProviderEnum.KAKAO: cls.KAKAO,
-            OAuthProviderEnum.GOOGLE: cls.GOOGLE,
-            OAuthProviderEnum.NAVER: cls.NAVER,
-        }
-        return provider_map[provider]
+        return cls._build(provider)
 
     @classmethod
     def is_supported(cls, provider: str) -> bool:
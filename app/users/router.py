@@ -4,7 +4,10 @@ Users 모듈 라우터
 인증, 프로필, 취향 설정, OAuth 엔드포인트를 정의합니다.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+import hashlib
+from typing import Annotated, NamedTuple
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,9 +17,6 @@ from app.core.security import decode_token
 from app.users.models import User
 from app.users.oauth_providers import OAuthProviders
 from app.users.schemas import (
-    ALLERGY_LABELS,
-    CUISINE_CATEGORY_LABELS,
-    DIETARY_RESTRICTION_LABELS,
     Allergy,
     CuisineCategory,
     DietaryRestriction,
@@ -49,6 +49,26 @@ router = APIRouter()
 security = HTTPBearer()
 
 
+# ==========================================================================
+# 서비스 의존성
+# ==========================================================================
+
+
+def get_profile_service(db: DbSession) -> ProfileService:
+    """프로필 서비스 의존성 (요청당 1회 생성)"""
+    return ProfileService(db)
+
+
+def get_preference_service(db: DbSession) -> PreferenceService:
+    """취향 설정 서비스 의존성 (요청당 1회 생성)"""
+    return PreferenceService(db)
+
+
+# 타입 어노테이션
+ProfileServiceDep = Annotated[ProfileService, Depends(get_profile_service)]
+PreferenceServiceDep = Annotated[PreferenceService, Depends(get_preference_service)]
+
+
 # ==========================================================================
 # 인증 엔드포인트 (Auth)
 # ==========================================================================
@@ -295,10 +315,9 @@ async def link_oauth_account(
 )
 async def get_my_profile(
     current_user_id: CurrentUserId,
-    db: DbSession,
+    profile_service: ProfileServiceDep,
 ) -> ProfileResponse:
     """내 프로필 조회"""
-    profile_service = ProfileService(db)
     profile_data = await profile_service.get_profile(current_user_id)
 
     if not profile_data:
@@ -326,10 +345,9 @@ async def get_my_profile(
 async def update_my_profile(
     data: ProfileUpdateRequest,
     current_user_id: CurrentUserId,
-    db: DbSession,
+    profile_service: ProfileServiceDep,
 ) -> ProfileResponse:
     """내 프로필 수정"""
-    profile_service = ProfileService(db)
     profile_data = await profile_service.update_profile(current_user_id, data)
 
     if not profile_data:
@@ -360,13 +378,12 @@ async def update_my_profile(
 )
 async def get_my_preferences(
     current_user_id: CurrentUserId,
-    db: DbSession,
+    profile_service: ProfileServiceDep,
+    preference_service: PreferenceServiceDep,
 ) -> PreferencesResponse:
     """내 취향 설정 조회"""
-    profile_service = ProfileService(db)
     await profile_service.ensure_profile_exists(current_user_id)
 
-    preference_service = PreferenceService(db)
     preferences_data = await preference_service.get_preferences(current_user_id)
 
     if not preferences_data:
@@ -394,13 +411,12 @@ async def get_my_preferences(
 async def update_my_preferences(
     data: PreferencesUpdateRequest,
     current_user_id: CurrentUserId,
-    db: DbSession,
+    profile_service: ProfileServiceDep,
+    preference_service: PreferenceServiceDep,
 ) -> PreferencesResponse:
     """내 취향 설정 수정"""
-    profile_service = ProfileService(db)
     await profile_service.ensure_profile_exists(current_user_id)
 
-    preference_service = PreferenceService(db)
     preferences_data = await preference_service.update_preferences(current_user_id, data)
 
     if not preferences_data:
@@ -417,6 +433,66 @@ async def update_my_preferences(
 # ==========================================================================
 
 
+class _CachedOptions(NamedTuple):
+    """직렬화된 옵션 목록 응답과 ETag"""
+
+    body: bytes
+    etag: str
+
+
+def _build_cached_options(
+    options: type[DietaryRestriction] | type[Allergy] | type[CuisineCategory],
+) -> _CachedOptions:
+    """Enum 멤버로 옵션 목록 응답 본문과 ETag 생성"""
+    body = OptionsResponse(
+        success=True,
+        data=[OptionItem(value=o.value, label=o.label) for o in options],
+    ).model_dump_json().encode("utf-8")
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    return _CachedOptions(body=body, etag=etag)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (RFC 9110 약한 비교)
+
+    쉼표로 구분된 여러 값, 약한 검증자(W/ 접두사), `*`를 처리합니다.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _options_response(cached: _CachedOptions, if_none_match: str | None) -> Response:
+    """캐시된 옵션 목록 응답 (ETag 일치 시 본문 없이 304)"""
+    if _etag_matches(if_none_match, cached.etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": cached.etag},
+        )
+    return Response(
+        content=cached.body,
+        media_type="application/json",
+        headers={"ETag": cached.etag},
+    )
+
+
+# 옵션 목록은 Enum 정의로만 결정되므로 모듈 로드 시 한 번 직렬화
+_DIETARY_OPTIONS = _build_cached_options(DietaryRestriction)
+_ALLERGY_OPTIONS = _build_cached_options(Allergy)
+_CUISINE_OPTIONS = _build_cached_options(CuisineCategory)
+
+# 타입 어노테이션
+IfNoneMatch = Annotated[str | None, Header()]
+
+
 @router.get(
     "/users/me/preferences/dietary-options",
     response_model=OptionsResponse,
@@ -424,13 +500,9 @@ async def update_my_preferences(
     summary="식이 제한 옵션 목록",
     description="설정 가능한 식이 제한 옵션 목록을 조회합니다.",
 )
-async def get_dietary_options() -> OptionsResponse:
+async def get_dietary_options(if_none_match: IfNoneMatch = None) -> Response:
     """식이 제한 옵션 목록 조회"""
-    options = [
-        OptionItem(value=d.value, label=DIETARY_RESTRICTION_LABELS[d])
-        for d in DietaryRestriction
-    ]
-    return OptionsResponse(success=True, data=options)
+    return _options_response(_DIETARY_OPTIONS, if_none_match)
 
 
 @router.get(
@@ -440,13 +512,9 @@ async def get_dietary_options() -> OptionsResponse:
     summary="알레르기 옵션 목록",
     description="설정 가능한 알레르기 옵션 목록을 조회합니다.",
 )
-async def get_allergy_options() -> OptionsResponse:
+async def get_allergy_options(if_none_match: IfNoneMatch = None) -> Response:
     """알레르기 옵션 목록 조회"""
-    options = [
-        OptionItem(value=a.value, label=ALLERGY_LABELS[a])
-        for a in Allergy
-    ]
-    return OptionsResponse(success=True, data=options)
+    return _options_response(_ALLERGY_OPTIONS, if_none_match)
 
 
 @router.get(
@@ -456,10 +524,6 @@ async def get_allergy_options() -> OptionsResponse:
     summary="요리 카테고리 옵션 목록",
     description="설정 가능한 요리 카테고리 옵션 목록을 조회합니다.",
 )
-async def get_cuisine_options() -> OptionsResponse:
+async def get_cuisine_options(if_none_match: IfNoneMatch = None) -> Response:
     """요리 카테고리 옵션 목록 조회"""
-    options = [
-        OptionItem(value=c.value, label=CUISINE_CATEGORY_LABELS[c])
-        for c in CuisineCategory
-    ]
-    return OptionsResponse(success=True, data=options)
+    return _options_response(_CUISINE_OPTIONS, if_none_match)
@@ -7,59 +7,99 @@ Users 모듈 Pydantic 스키마
 import re
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Literal, Optional
+from typing import Annotated, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    field_validator,
+)
 
 from app.core.config import settings
 
+# 비밀번호 정책 검사용 정규식 (모듈 로드 시 한 번 컴파일)
+_HAS_LETTER = re.compile(r"[a-zA-Z]").search
+_HAS_DIGIT = re.compile(r"\d").search
+
+# 로그인용 이메일 형식 검사 (가입 시 EmailStr로 검증된 주소를 조회만 하므로 간단한 형식 확인)
+_LOGIN_EMAIL_MATCH = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+").fullmatch
+
+
+def _validate_login_email(v: str) -> str:
+    """로그인 이메일 형식 확인 및 정규화 (소문자)"""
+    v = v.strip().lower()
+    if not _LOGIN_EMAIL_MATCH(v):
+        raise ValueError("유효한 이메일 주소 형식이 아닙니다.")
+    return v
+
+
+LoginEmail = Annotated[str, AfterValidator(_validate_login_email)]
+
 
 # ==========================================================================
 # Enums
 # ==========================================================================
 
 
-class DietaryRestriction(str, Enum):
+class _LabeledEnum(str, Enum):
+    """표시용 라벨을 멤버 속성으로 갖는 문자열 Enum
+
+    멤버는 (값, 라벨) 튜플로 정의하며, 라벨은 `member.label`로 조회합니다.
+    """
+
+    label: str
+
+    def __new__(cls, value: str, label: str) -> "_LabeledEnum":
+        obj = str.__new__(cls, value)
+        obj._value_ = value
+        obj.label = label
+        return obj
+
+
+class DietaryRestriction(_LabeledEnum):
     """식이 제한 유형"""
 
-    VEGETARIAN = "vegetarian"  # 채식 (유제품/계란 허용)
-    VEGAN = "vegan"  # 비건 (동물성 제품 불가)
-    PESCATARIAN = "pescatarian"  # 페스코 (해산물 허용)
-    HALAL = "halal"  # 할랄
-    KOSHER = "kosher"  # 코셔
-    GLUTEN_FREE = "gluten_free"  # 글루텐 프리
-    LACTOSE_FREE = "lactose_free"  # 유당 불내증
-    LOW_SODIUM = "low_sodium"  # 저염식
-    LOW_SUGAR = "low_sugar"  # 저당식
+    VEGETARIAN = ("vegetarian", "채식 (유제품/계란 허용)")
+    VEGAN = ("vegan", "비건 (동물성 제품 불가)")
+    PESCATARIAN = ("pescatarian", "페스코 (해산물 허용)")
+    HALAL = ("halal", "할랄")
+    KOSHER = ("kosher", "코셔")
+    GLUTEN_FREE = ("gluten_free", "글루텐 프리")
+    LACTOSE_FREE = ("lactose_free", "유당 불내증")
+    LOW_SODIUM = ("low_sodium", "저염식")
+    LOW_SUGAR = ("low_sugar", "저당식")
 
 
-class Allergy(str, Enum):
+class Allergy(_LabeledEnum):
     """알레르기 유형"""
 
-    PEANUT = "peanut"  # 땅콩
-    TREE_NUT = "tree_nut"  # 견과류
-    MILK = "milk"  # 우유
-    EGG = "egg"  # 달걀
-    WHEAT = "wheat"  # 밀
-    SOY = "soy"  # 대두
-    FISH = "fish"  # 생선
-    SHELLFISH = "shellfish"  # 갑각류/조개류
-    SESAME = "sesame"  # 참깨
+    PEANUT = ("peanut", "땅콩")
+    TREE_NUT = ("tree_nut", "견과류")
+    MILK = ("milk", "우유")
+    EGG = ("egg", "달걀")
+    WHEAT = ("wheat", "밀")
+    SOY = ("soy", "대두")
+    FISH = ("fish", "생선")
+    SHELLFISH = ("shellfish", "갑각류/조개류")
+    SESAME = ("sesame", "참깨")
 
 
-class CuisineCategory(str, Enum):
+class CuisineCategory(_LabeledEnum):
     """요리 카테고리"""
 
-    KOREAN = "korean"  # 한식
-    JAPANESE = "japanese"  # 일식
-    CHINESE = "chinese"  # 중식
-    WESTERN = "western"  # 양식
-    ITALIAN = "italian"  # 이탈리안
-    MEXICAN = "mexican"  # 멕시칸
-    THAI = "thai"  # 태국
-    VIETNAMESE = "vietnamese"  # 베트남
-    INDIAN = "indian"  # 인도
-    FUSION = "fusion"  # 퓨전
+    KOREAN = ("korean", "한식")
+    JAPANESE = ("japanese", "일식")
+    CHINESE = ("chinese", "중식")
+    WESTERN = ("western", "양식")
+    ITALIAN = ("italian", "이탈리안")
+    MEXICAN = ("mexican", "멕시칸")
+    THAI = ("thai", "태국")
+    VIETNAMESE = ("vietnamese", "베트남")
+    INDIAN = ("indian", "인도")
+    FUSION = ("fusion", "퓨전")
 
 
 class OAuthProviderEnum(str, Enum):
@@ -70,43 +110,15 @@ class OAuthProviderEnum(str, Enum):
     NAVER = "naver"
 
 
-# 프론트엔드 표시용 라벨 매핑
-DIETARY_RESTRICTION_LABELS = {
-    DietaryRestriction.VEGETARIAN: "채식 (유제품/계란 허용)",
-    DietaryRestriction.VEGAN: "비건 (동물성 제품 불가)",
-    DietaryRestriction.PESCATARIAN: "페스코 (해산물 허용)",
-    DietaryRestriction.HALAL: "할랄",
-    DietaryRestriction.KOSHER: "코셔",
-    DietaryRestriction.GLUTEN_FREE: "글루텐 프리",
-    DietaryRestriction.LACTOSE_FREE: "유당 불내증",
-    DietaryRestriction.LOW_SODIUM: "저염식",
-    DietaryRestriction.LOW_SUGAR: "저당식",
-}
-
-ALLERGY_LABELS = {
-    Allergy.PEANUT: "땅콩",
-    Allergy.TREE_NUT: "견과류",
-    Allergy.MILK: "우유",
-    Allergy.EGG: "달걀",
-    Allergy.WHEAT: "밀",
-    Allergy.SOY: "대두",
-    Allergy.FISH: "생선",
-    Allergy.SHELLFISH: "갑각류/조개류",
-    Allergy.SESAME: "참깨",
-}
-
-CUISINE_CATEGORY_LABELS = {
-    CuisineCategory.KOREAN: "한식",
-    CuisineCategory.JAPANESE: "일식",
-    CuisineCategory.CHINESE: "중식",
-    CuisineCategory.WESTERN: "양식",
-    CuisineCategory.ITALIAN: "이탈리안",
-    CuisineCategory.MEXICAN: "멕시칸",
-    CuisineCategory.THAI: "태국",
-    CuisineCategory.VIETNAMESE: "베트남",
-    CuisineCategory.INDIAN: "인도",
-    CuisineCategory.FUSION: "퓨전",
-}
+# 프론트엔드 표시용 라벨 매핑 (하위 호환용, 각 멤버의 label에서 생성)
+DIETARY_RESTRICTION_LABELS = {d: d.label for d in DietaryRestriction}
+ALLERGY_LABELS = {a: a.label for a in Allergy}
+CUISINE_CATEGORY_LABELS = {c: c.label for c in CuisineCategory}
+
+# 맛 취향 허용 키 (overall + 요리 카테고리, 모듈 로드 시 한 번 생성)
+_VALID_TASTE_KEYS: frozenset[str] = frozenset(
+    {"overall", *(c.value for c in CuisineCategory)}
+)
 
 
 # ==========================================================================
@@ -134,10 +146,10 @@ class RegisterRequest(BaseModel):
                 f"비밀번호는 최소 {settings.PASSWORD_MIN_LENGTH}자 이상이어야 합니다."
             )
 
-        if not re.search(r"[a-zA-Z]", v):
+        if not _HAS_LETTER(v):
             raise ValueError("비밀번호는 최소 1개의 영문자를 포함해야 합니다.")
 
-        if not re.search(r"\d", v):
+        if not _HAS_DIGIT(v):
             raise ValueError("비밀번호는 최소 1개의 숫자를 포함해야 합니다.")
 
         return v
@@ -152,15 +164,9 @@ class RegisterRequest(BaseModel):
 class LoginRequest(BaseModel):
     """로그인 요청 스키마"""
 
-    email: EmailStr = Field(..., description="사용자 이메일 주소")
+    email: LoginEmail = Field(..., max_length=255, description="사용자 이메일 주소")
     password: str = Field(..., description="비밀번호")
 
-    @field_validator("email")
-    @classmethod
-    def normalize_email(cls, v: str) -> str:
-        """이메일 정규화 (소문자)"""
-        return v.lower().strip()
-
 
 class TokenResponse(BaseModel):
     """토큰 발급 응답 스키마"""
@@ -186,7 +192,7 @@ class RegisterResponse(BaseModel):
     """회원가입 응답 스키마"""
 
     id: str = Field(..., description="생성된 사용자 ID")
-    email: EmailStr = Field(..., description="등록된 이메일 주소")
+    email: str = Field(..., description="등록된 이메일 주소")
     created_at: datetime = Field(..., description="계정 생성 시각")
 
 
@@ -194,13 +200,13 @@ class UserResponse(BaseModel):
     """사용자 정보 응답 스키마"""
 
     id: str = Field(..., description="사용자 ID")
-    email: EmailStr = Field(..., description="이메일 주소")
+    email: str = Field(..., description="이메일 주소")
     status: Literal["ACTIVE", "INACTIVE", "LOCKED"] = Field(
         ..., description="계정 상태"
     )
     created_at: datetime = Field(..., description="계정 생성 시각")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class UserInDB(BaseModel):
@@ -214,7 +220,7 @@ class UserInDB(BaseModel):
     updated_at: datetime
     locked_until: datetime | None = None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ==========================================================================
@@ -236,24 +242,21 @@ class ProfileUpdateRequest(BaseModel):
     profile_image_url: Optional[str] = Field(
         None,
         max_length=2048,
-        description="프로필 이미지 URL",
+        description="프로필 이미지 URL (빈 문자열이면 이미지 삭제)",
         alias="profileImageUrl",
         examples=["https://cdn.naecipe.com/profiles/user123.jpg"],
     )
 
+    model_config = ConfigDict(populate_by_name=True)
+
     @field_validator("profile_image_url")
     @classmethod
     def validate_url_format(cls, v: Optional[str]) -> Optional[str]:
-        """URL 형식 검증"""
-        if v is None:
-            return v
-        if v and not (v.startswith("http://") or v.startswith("https://")):
+        """URL 형식 검증 (빈 문자열은 이미지 삭제로 허용, 값은 입력 그대로 저장)"""
+        if v and not v.startswith(("http://", "https://")):
             raise ValueError("유효한 URL 형식이 아닙니다 (http/https)")
         return v
 
-    class Config:
-        populate_by_name = True
-
 
 class ProfileData(BaseModel):
     """프로필 데이터 응답"""
@@ -269,9 +272,7 @@ class ProfileData(BaseModel):
         ..., description="프로필 수정 시각", alias="updatedAt"
     )
 
-    class Config:
-        populate_by_name = True
-        from_attributes = True
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
 
 
 class ProfileResponse(BaseModel):
@@ -280,6 +281,8 @@ class ProfileResponse(BaseModel):
     success: bool = True
     data: ProfileData
 
+    model_config = ConfigDict(frozen=True)
+
 
 # ==========================================================================
 # 취향 설정 스키마
@@ -322,16 +325,6 @@ class PreferencesUpdateRequest(BaseModel):
         alias="tastePreferences",
     )
 
-    @field_validator("cuisine_preferences")
-    @classmethod
-    def validate_cuisine_preferences_count(
-        cls, v: Optional[List[CuisineCategory]]
-    ) -> Optional[List[CuisineCategory]]:
-        """선호 요리 카테고리 최대 10개 제한"""
-        if v is not None and len(v) > 10:
-            raise ValueError("선호 요리 카테고리는 최대 10개까지 설정 가능합니다")
-        return v
-
     @field_validator("taste_preferences")
     @classmethod
     def validate_taste_preference_keys(
@@ -340,14 +333,13 @@ class PreferencesUpdateRequest(BaseModel):
         """맛 취향 키 검증"""
         if v is None:
             return v
-        valid_keys = {"overall"} | {c.value for c in CuisineCategory}
-        for key in v.keys():
-            if key not in valid_keys:
-                raise ValueError(f"허용되지 않는 카테고리입니다: {key}")
+        invalid_keys = v.keys() - _VALID_TASTE_KEYS
+        if invalid_keys:
+            key = next(k for k in v if k in invalid_keys)
+            raise ValueError(f"허용되지 않는 카테고리입니다: {key}")
         return v
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class TastePreferenceData(BaseModel):
@@ -384,9 +376,7 @@ class PreferencesData(BaseModel):
         None, description="취향 설정 수정 시각", alias="updatedAt"
     )
 
-    class Config:
-        populate_by_name = True
-        from_attributes = True
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
 
 
 class PreferencesResponse(BaseModel):
@@ -395,6 +385,8 @@ class PreferencesResponse(BaseModel):
     success: bool = True
     data: PreferencesData
 
+    model_config = ConfigDict(frozen=True)
+
 
 class OptionItem(BaseModel):
     """옵션 항목"""
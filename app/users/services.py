@@ -5,10 +5,11 @@ Users 모듈 서비스 레이어
 """
 
 from datetime import datetime, timedelta, timezone
-from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import and_, bindparam, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload
 
 from app.core.config import settings
 from app.core.exceptions import (
@@ -22,10 +23,13 @@ from app.core.exceptions import (
 from app.core.security import (
     create_access_token,
     create_refresh_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    new_jti,
+    password_needs_rehash,
+    verify_password_async,
     verify_refresh_token,
 )
+from app.infra.database import generate_uuid_str
 from app.infra.redis import get_redis
 from app.users.models import OAuthAccount, OAuthProvider, TastePreference, User, UserProfile, UserStatus
 from app.users.schemas import (
@@ -46,6 +50,29 @@ from app.users.schemas import (
 )
 
 
+# ==========================================================================
+# 사전 구성 쿼리
+# ==========================================================================
+
+# 로그인/토큰 갱신마다 실행되는 사용자 조회 쿼리는 모듈 로드 시 한 번 구성하고
+# 호출 시에는 바인드 파라미터만 전달합니다.
+_USER_BY_EMAIL_STMT = select(User).where(User.email == bindparam("email"))
+_USER_BY_ID_STMT = select(User).where(User.id == bindparam("user_id"))
+# 회원가입 중복 확인용: 관계 로드 없이 id만 조회
+_EMAIL_EXISTS_STMT = select(User.id).where(User.email == bindparam("email"))
+
+# 맛 취향 항목 (TasteValues/TastePreference 공통 필드)
+_TASTE_FIELDS = ("sweetness", "saltiness", "spiciness", "sourness")
+_DEFAULT_TASTE_VALUE = 3  # TastePreference 컬럼 기본값과 동일
+
+# 프로필 API용: 프로필은 조인으로 함께 가져오고 나머지 관계(selectin 기본값)는 로드하지 않음
+_USER_WITH_PROFILE_STMT = (
+    select(User)
+    .options(joinedload(User.profile), raiseload("*"))
+    .where(User.id == bindparam("user_id"))
+)
+
+
 # ==========================================================================
 # Session Service
 # ==========================================================================
@@ -63,7 +90,7 @@ class SessionService:
     async def store_refresh_token(cls, user_id: str, refresh_token: str) -> None:
         """Redis에 리프레시 토큰 저장"""
         redis = await get_redis()
-        key = f"{cls.SESSION_PREFIX}{user_id}"
+        key = cls.SESSION_PREFIX + user_id
         expire_seconds = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
 
         await redis.set(key, refresh_token, ex=expire_seconds)
@@ -72,7 +99,7 @@ class SessionService:
     async def get_refresh_token(cls, user_id: str) -> str | None:
         """저장된 리프레시 토큰 조회"""
         redis = await get_redis()
-        key = f"{cls.SESSION_PREFIX}{user_id}"
+        key = cls.SESSION_PREFIX + user_id
 
         return await redis.get(key)
 
@@ -80,7 +107,7 @@ class SessionService:
     async def delete_session(cls, user_id: str) -> None:
         """세션 삭제 (로그아웃)"""
         redis = await get_redis()
-        key = f"{cls.SESSION_PREFIX}{user_id}"
+        key = cls.SESSION_PREFIX + user_id
 
         await redis.delete(key)
 
@@ -88,7 +115,7 @@ class SessionService:
     async def blacklist_token(cls, token_jti: str, expires_in: int) -> None:
         """액세스 토큰 블랙리스트 추가"""
         redis = await get_redis()
-        key = f"{cls.BLACKLIST_PREFIX}{token_jti}"
+        key = cls.BLACKLIST_PREFIX + token_jti
 
         await redis.set(key, "1", ex=expires_in)
 
@@ -96,7 +123,7 @@ class SessionService:
     async def is_token_blacklisted(cls, token_jti: str) -> bool:
         """토큰 블랙리스트 여부 확인"""
         redis = await get_redis()
-        key = f"{cls.BLACKLIST_PREFIX}{token_jti}"
+        key = cls.BLACKLIST_PREFIX + token_jti
 
         return await redis.exists(key) > 0
 
@@ -104,7 +131,7 @@ class SessionService:
     async def get_login_failure_count(cls, email: str) -> int:
         """로그인 실패 횟수 조회"""
         redis = await get_redis()
-        key = f"{cls.LOGIN_FAILURE_PREFIX}{email.lower()}"
+        key = cls.LOGIN_FAILURE_PREFIX + email.lower()
 
         count = await redis.get(key)
         return int(count) if count else 0
@@ -113,21 +140,31 @@ class SessionService:
     async def increment_login_failure(cls, email: str) -> int:
         """로그인 실패 횟수 증가"""
         redis = await get_redis()
-        key = f"{cls.LOGIN_FAILURE_PREFIX}{email.lower()}"
+        key = cls.LOGIN_FAILURE_PREFIX + email.lower()
         expire_seconds = settings.ACCOUNT_LOCK_MINUTES * 60
 
-        count = await redis.incr(key)
-        await redis.expire(key, expire_seconds)
+        # INCR + EXPIRE를 MULTI/EXEC로 묶어 한 번의 왕복으로 원자적 실행
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, expire_seconds)
+            count, _ = await pipe.execute()
 
         return count
 
     @classmethod
-    async def reset_login_failure(cls, email: str) -> None:
-        """로그인 실패 횟수 초기화"""
+    async def on_login_success(
+        cls, user_id: str, email: str, refresh_token: str
+    ) -> None:
+        """로그인 성공 처리 - 리프레시 토큰 저장과 실패 카운터 초기화를 한 번의 왕복으로 실행"""
         redis = await get_redis()
-        key = f"{cls.LOGIN_FAILURE_PREFIX}{email.lower()}"
+        session_key = cls.SESSION_PREFIX + user_id
+        failure_key = cls.LOGIN_FAILURE_PREFIX + email.lower()
+        expire_seconds = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
 
-        await redis.delete(key)
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.set(session_key, refresh_token, ex=expire_seconds)
+            pipe.delete(failure_key)
+            await pipe.execute()
 
 
 # ==========================================================================
@@ -145,55 +182,53 @@ class UserService:
         """이메일/비밀번호로 새 사용자 생성"""
         email = request.email.lower()
 
-        # 중복 이메일 확인
-        if await self._email_exists(email):
+        # 중복 이메일이면 bcrypt 해싱 전에 거부 (가벼운 id 조회)
+        existing = await self.db.execute(_EMAIL_EXISTS_STMT, {"email": email})
+        if existing.first() is not None:
             raise EmailExistsError()
 
         # 비밀번호 해싱
-        password_hash = hash_password(request.password)
+        password_hash = await hash_password_async(request.password)
 
-        # 사용자 생성
-        user = User(
-            email=email,
-            password_hash=password_hash,
-            status=UserStatus.ACTIVE,
+        # 사용자 생성 (확인 이후 동시 가입 경합은 INSERT ... ON CONFLICT로 판정)
+        result = await self.db.execute(
+            pg_insert(User)
+            .values(
+                email=email,
+                password_hash=password_hash,
+                status=UserStatus.ACTIVE,
+            )
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User.id, User.created_at)
         )
-
-        self.db.add(user)
-        await self.db.flush()
-        await self.db.refresh(user)
+        row = result.first()
+        if row is None:
+            raise EmailExistsError()
 
         # 프로필 자동 생성
         profile = UserProfile(
-            user_id=user.id,
+            user_id=row.id,
             display_name="",
         )
         self.db.add(profile)
         await self.db.flush()
 
         return RegisterResponse(
-            id=user.id,
-            email=user.email,
-            created_at=user.created_at,
-        )
-
-    async def _email_exists(self, email: str) -> bool:
-        """이메일 존재 여부 확인 (대소문자 구분 안 함)"""
-        result = await self.db.execute(
-            select(User.id).where(User.email == email.lower())
+            id=row.id,
+            email=email,
+            created_at=row.created_at,
         )
-        return result.scalar_one_or_none() is not None
 
     async def get_user_by_email(self, email: str) -> User | None:
         """이메일로 사용자 조회"""
         result = await self.db.execute(
-            select(User).where(User.email == email.lower())
+            _USER_BY_EMAIL_STMT, {"email": email.lower()}
         )
         return result.scalar_one_or_none()
 
     async def get_user_by_id(self, user_id: str) -> User | None:
         """ID로 사용자 조회"""
-        result = await self.db.execute(select(User).where(User.id == user_id))
+        result = await self.db.execute(_USER_BY_ID_STMT, {"user_id": user_id})
         return result.scalar_one_or_none()
 
 
@@ -213,11 +248,11 @@ class AuthService:
         email = email.lower()
 
         # 계정 잠금 확인 (Redis 실패 카운터)
+        # 잠긴 계정은 사용자 조회(DB) 없이 바로 거부하도록 카운터를 먼저 확인
         failure_count = await SessionService.get_login_failure_count(email)
         if failure_count >= settings.LOGIN_FAILURE_LIMIT:
             raise AccountLockedError()
 
-        # 사용자 조회
         user = await self._get_user_by_email(email)
         if not user:
             await self._handle_login_failure(email)
@@ -227,30 +262,35 @@ class AuthService:
         if user.status == UserStatus.LOCKED:
             if user.locked_until and user.locked_until > datetime.now(timezone.utc):
                 raise AccountLockedError()
-            # 잠금 만료, 상태 초기화
-            user.status = UserStatus.ACTIVE
-            user.locked_until = None
+            # 잠금 만료, 상태 초기화 (조건부 UPDATE 한 번, 세션 내 객체에도 반영됨)
+            await self.db.execute(
+                update(User)
+                .where(User.id == user.id, User.status == UserStatus.LOCKED)
+                .values(status=UserStatus.ACTIVE, locked_until=None)
+                .execution_options(synchronize_session="evaluate")
+            )
 
         if user.status != UserStatus.ACTIVE:
             await self._handle_login_failure(email)
             raise AuthenticationError(detail="비활성화된 계정입니다.")
 
         # 비밀번호 검증
-        if not user.password_hash or not verify_password(
+        if not user.password_hash or not await verify_password_async(
             password, user.password_hash
         ):
             await self._handle_login_failure(email)
             raise AuthenticationError(detail="이메일 또는 비밀번호가 올바르지 않습니다.")
 
-        # 성공 시 실패 카운터 초기화
-        await SessionService.reset_login_failure(email)
+        # 해싱 정책이 바뀐 경우 로그인 시점에 새 정책으로 재해싱
+        if password_needs_rehash(user.password_hash):
+            user.password_hash = await hash_password_async(password)
 
         # 토큰 생성
         access_token = create_access_token(str(user.id))
-        refresh_token = create_refresh_token(str(user.id), jti=str(uuid4()))
+        refresh_token = create_refresh_token(str(user.id), jti=new_jti())
 
-        # 세션에 리프레시 토큰 저장
-        await SessionService.store_refresh_token(str(user.id), refresh_token)
+        # 세션에 리프레시 토큰 저장 + 실패 카운터 초기화
+        await SessionService.on_login_success(str(user.id), email, refresh_token)
 
         return TokenResponse(
             access_token=access_token,
@@ -285,7 +325,7 @@ class AuthService:
 
         # 새 토큰 생성 (토큰 로테이션)
         new_access_token = create_access_token(user_id)
-        new_refresh_token = create_refresh_token(user_id, jti=str(uuid4()))
+        new_refresh_token = create_refresh_token(user_id, jti=new_jti())
 
         # 새 리프레시 토큰으로 세션 갱신
         await SessionService.store_refresh_token(user_id, new_refresh_token)
@@ -308,15 +348,13 @@ class AuthService:
             await SessionService.blacklist_token(token_jti, expires_in)
 
     async def _get_user_by_email(self, email: str) -> User | None:
-        """이메일로 사용자 조회"""
-        result = await self.db.execute(
-            select(User).where(User.email == email.lower())
-        )
+        """이메일로 사용자 조회 (호출자가 소문자로 정규화한 이메일 전달)"""
+        result = await self.db.execute(_USER_BY_EMAIL_STMT, {"email": email})
         return result.scalar_one_or_none()
 
     async def _get_user_by_id(self, user_id: str) -> User | None:
         """ID로 사용자 조회"""
-        result = await self.db.execute(select(User).where(User.id == user_id))
+        result = await self.db.execute(_USER_BY_ID_STMT, {"user_id": user_id})
         return result.scalar_one_or_none()
 
     async def _handle_login_failure(self, email: str) -> None:
@@ -347,7 +385,7 @@ class ProfileService:
 
     async def get_profile(self, user_id: str) -> ProfileData | None:
         """사용자 프로필 조회"""
-        result = await self.db.execute(select(User).where(User.id == user_id))
+        result = await self.db.execute(_USER_WITH_PROFILE_STMT, {"user_id": user_id})
         user = result.scalar_one_or_none()
 
         if not user:
@@ -372,7 +410,7 @@ class ProfileService:
         data: ProfileUpdateRequest,
     ) -> ProfileData | None:
         """사용자 프로필 수정"""
-        result = await self.db.execute(select(User).where(User.id == user_id))
+        result = await self.db.execute(_USER_WITH_PROFILE_STMT, {"user_id": user_id})
         user = result.scalar_one_or_none()
 
         if not user:
@@ -387,8 +425,8 @@ class ProfileService:
         if data.profile_image_url is not None:
             profile.profile_image_url = data.profile_image_url
 
+        # updated_at은 eager_defaults로 UPDATE ... RETURNING 시 함께 갱신됨
         await self.db.flush()
-        await self.db.refresh(profile)
 
         return ProfileData(
             id=user.id,
@@ -407,7 +445,6 @@ class ProfileService:
         )
         self.db.add(profile)
         await self.db.flush()
-        await self.db.refresh(profile)
         return profile
 
     async def ensure_profile_exists(self, user_id: str) -> UserProfile:
@@ -436,48 +473,23 @@ class PreferenceService:
 
     async def get_preferences(self, user_id: str) -> PreferencesData | None:
         """사용자 취향 설정 조회"""
-        result = await self.db.execute(
-            select(UserProfile).where(UserProfile.user_id == user_id)
-        )
-        profile = result.scalar_one_or_none()
+        profile, taste_prefs = await self._load_profile_with_tastes(user_id)
 
         if not profile:
             return None
 
-        taste_result = await self.db.execute(
-            select(TastePreference).where(TastePreference.user_id == user_id)
-        )
-        taste_prefs = taste_result.scalars().all()
-
-        taste_dict = {}
-        for pref in taste_prefs:
-            taste_dict[pref.category] = TastePreferenceData(
-                sweetness=pref.sweetness,
-                saltiness=pref.saltiness,
-                spiciness=pref.spiciness,
-                sourness=pref.sourness,
-            )
-
-        return PreferencesData(
-            dietaryRestrictions=profile.dietary_restrictions or [],
-            allergies=profile.allergies or [],
-            cuisinePreferences=profile.cuisine_preferences or [],
-            skillLevel=profile.skill_level,
-            householdSize=profile.household_size,
-            tastePreferences=taste_dict,
-            updatedAt=profile.updated_at,
-        )
+        return self._build_preferences_data(profile, taste_prefs)
 
     async def update_preferences(
         self,
         user_id: str,
         data: PreferencesUpdateRequest,
     ) -> PreferencesData | None:
-        """사용자 취향 설정 수정"""
-        result = await self.db.execute(
-            select(UserProfile).where(UserProfile.user_id == user_id)
-        )
-        profile = result.scalar_one_or_none()
+        """사용자 취향 설정 수정
+
+        수정에 쓰려고 불러온 프로필과 맛 취향 객체로 응답을 바로 만듭니다 (재조회 없음).
+        """
+        profile, taste_prefs = await self._load_profile_with_tastes(user_id)
 
         if not profile:
             return None
@@ -494,65 +506,126 @@ class PreferenceService:
             profile.household_size = data.household_size
 
         if data.taste_preferences is not None:
-            await self._update_taste_preferences(user_id, data.taste_preferences)
+            await self._update_taste_preferences(
+                user_id, data.taste_preferences, taste_prefs
+            )
 
+        # updated_at은 UserProfile의 eager_defaults로 UPDATE ... RETURNING 시 함께 갱신됨
         await self.db.flush()
-        await self.db.refresh(profile)
 
-        return await self.get_preferences(user_id)
+        return self._build_preferences_data(profile, taste_prefs)
+
+    async def _load_profile_with_tastes(
+        self, user_id: str,
+    ) -> tuple[UserProfile | None, dict[str, TastePreference]]:
+        """프로필과 맛 취향을 외부 조인 한 번으로 함께 조회"""
+        result = await self.db.execute(
+            select(UserProfile, TastePreference)
+            .outerjoin(
+                TastePreference, TastePreference.user_id == UserProfile.user_id
+            )
+            .where(UserProfile.user_id == user_id)
+        )
+        rows = result.all()
+
+        if not rows:
+            return None, {}
+
+        taste_prefs = {pref.category: pref for _, pref in rows if pref is not None}
+        return rows[0][0], taste_prefs
+
+    @staticmethod
+    def _build_preferences_data(
+        profile: UserProfile,
+        taste_prefs: dict[str, TastePreference],
+    ) -> PreferencesData:
+        """프로필/맛 취향 객체로 응답 데이터 생성"""
+        taste_dict = {}
+        for category, pref in taste_prefs.items():
+            taste_dict[category] = TastePreferenceData(
+                sweetness=pref.sweetness,
+                saltiness=pref.saltiness,
+                spiciness=pref.spiciness,
+                sourness=pref.sourness,
+            )
+
+        return PreferencesData(
+            dietaryRestrictions=profile.dietary_restrictions or [],
+            allergies=profile.allergies or [],
+            cuisinePreferences=profile.cuisine_preferences or [],
+            skillLevel=profile.skill_level,
+            householdSize=profile.household_size,
+            tastePreferences=taste_dict,
+            updatedAt=profile.updated_at,
+        )
 
     async def _update_taste_preferences(
         self,
         user_id: str,
         taste_data: dict,
+        existing_prefs: dict[str, TastePreference],
     ) -> None:
-        """맛 취향 업데이트"""
-        existing_result = await self.db.execute(
-            select(TastePreference).where(TastePreference.user_id == user_id)
-        )
-        existing_prefs = {p.category: p for p in existing_result.scalars().all()}
+        """맛 취향 업데이트 (카테고리 전체를 upsert 한 번으로 반영)
+
+        최종 값을 Python에서 미리 계산한 뒤 INSERT ... ON CONFLICT DO UPDATE로
+        한 번에 저장하고, 반환된 행으로 existing_prefs를 갱신합니다.
+        """
+        if not taste_data:
+            return
 
         overall_values = taste_data.get("overall")
 
+        rows = []
         for category, values in taste_data.items():
-            if category in existing_prefs:
-                pref = existing_prefs[category]
-                self._apply_taste_values(pref, values, overall_values, category != "overall")
-            else:
-                pref = TastePreference(
-                    user_id=user_id,
-                    category=category,
+            row = {
+                "id": generate_uuid_str(),
+                "user_id": user_id,
+                "category": category,
+            }
+            row.update(
+                self._resolve_taste_values(
+                    values,
+                    overall_values if category != "overall" else None,
+                    existing_prefs.get(category),
                 )
-                self._apply_taste_values(pref, values, overall_values, category != "overall")
-                self.db.add(pref)
+            )
+            rows.append(row)
+
+        insert_stmt = pg_insert(TastePreference).values(rows)
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[TastePreference.user_id, TastePreference.category],
+            # ON CONFLICT 경로에는 onupdate가 적용되지 않으므로 updated_at을 직접 지정
+            set_={
+                **{field: insert_stmt.excluded[field] for field in _TASTE_FIELDS},
+                "updated_at": func.now(),
+            },
+        ).returning(TastePreference)
 
-    def _apply_taste_values(
-        self,
-        pref: TastePreference,
+        result = await self.db.execute(
+            upsert_stmt, execution_options={"populate_existing": True}
+        )
+        for pref in result.scalars():
+            existing_prefs[pref.category] = pref
+
+    @staticmethod
+    def _resolve_taste_values(
         values: TasteValues,
         overall_values: TasteValues | None,
-        inherit_overall: bool,
-    ) -> None:
-        """맛 취향 값 적용"""
-        if values.sweetness is not None:
-            pref.sweetness = values.sweetness
-        elif inherit_overall and overall_values and overall_values.sweetness is not None:
-            pref.sweetness = overall_values.sweetness
-
-        if values.saltiness is not None:
-            pref.saltiness = values.saltiness
-        elif inherit_overall and overall_values and overall_values.saltiness is not None:
-            pref.saltiness = overall_values.saltiness
-
-        if values.spiciness is not None:
-            pref.spiciness = values.spiciness
-        elif inherit_overall and overall_values and overall_values.spiciness is not None:
-            pref.spiciness = overall_values.spiciness
-
-        if values.sourness is not None:
-            pref.sourness = values.sourness
-        elif inherit_overall and overall_values and overall_values.sourness is not None:
-            pref.sourness = overall_values.sourness
+        current: TastePreference | None,
+    ) -> dict[str, int]:
+        """맛 취향 최종 값 계산
+
+        요청 값 → overall 값 상속 → 기존 값 → 기본값 순으로 결정합니다.
+        """
+        resolved = {}
+        for field in _TASTE_FIELDS:
+            value = getattr(values, field)
+            if value is None and overall_values:
+                value = getattr(overall_values, field)
+            if value is None:
+                value = getattr(current, field) if current else _DEFAULT_TASTE_VALUE
+            resolved[field] = value
+        return resolved
 
 
 # ==========================================================================
@@ -580,25 +653,16 @@ class OAuthService:
         state = secrets.token_urlsafe(32)
 
         redis = await get_redis()
-        state_key = f"{self.OAUTH_STATE_PREFIX}{state}"
+        state_key = self.OAUTH_STATE_PREFIX + state
         await redis.set(
             state_key,
             provider.value,
             ex=settings.OAUTH_STATE_EXPIRE_SECONDS,
         )
 
-        params = {
-            "client_id": config.client_id,
-            "redirect_uri": config.redirect_uri,
-            "response_type": "code",
-            "state": state,
-        }
-
-        if config.scopes:
-            params["scope"] = " ".join(config.scopes)
-
-        query_string = "&".join(f"{k}={v}" for k, v in params.items())
-        authorization_url = f"{config.authorization_url}?{query_string}"
+        # 고정 파라미터는 제공자 설정에 미리 인코딩되어 있으며 state만 덧붙임
+        # (token_urlsafe 값은 URL 안전 문자만 포함하므로 인코딩 불필요)
+        authorization_url = f"{config.authorization_url_prefix}&state={state}"
 
         return OAuthAuthorizationResponse(
             authorization_url=authorization_url,
@@ -615,7 +679,7 @@ class OAuthService:
         user, oauth_account, is_new_user = await self._find_or_create_user(oauth_user_data)
 
         access_token = create_access_token(str(user.id))
-        refresh_token = create_refresh_token(str(user.id), jti=str(uuid4()))
+        refresh_token = create_refresh_token(str(user.id), jti=new_jti())
 
         await SessionService.store_refresh_token(str(user.id), refresh_token)
 
@@ -665,14 +729,13 @@ class OAuthService:
         from app.core.exceptions import OAuthStateError
 
         redis = await get_redis()
-        state_key = f"{self.OAUTH_STATE_PREFIX}{state}"
+        state_key = self.OAUTH_STATE_PREFIX + state
 
-        stored_provider = await redis.get(state_key)
+        # 조회와 삭제를 GETDEL 한 번으로 원자적으로 처리 (state 재사용 방지)
+        stored_provider = await redis.getdel(state_key)
         if not stored_provider:
             raise OAuthStateError()
 
-        await redis.delete(state_key)
-
         if stored_provider != expected_provider.value:
             raise OAuthStateError()
 
@@ -681,7 +744,9 @@ class OAuthService:
     ) -> str:
         """인가 코드를 액세스 토큰으로 교환"""
         import httpx
+        import orjson
         from app.core.exceptions import OAuthProviderError
+        from app.infra.http import get_http_client
         from app.users.oauth_providers import OAuthProviders
 
         config = OAuthProviders.get(provider)
@@ -694,79 +759,76 @@ class OAuthService:
             "code": code,
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    config.token_url,
-                    data=data,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                    timeout=10.0,
-                )
-                response.raise_for_status()
-
-                token_data = response.json()
-                access_token = token_data.get("access_token")
-
-                if not access_token:
-                    raise OAuthProviderError(
-                        provider=provider.value,
-                        detail="액세스 토큰을 받지 못했습니다.",
-                    )
+        client = get_http_client()
+        try:
+            response = await client.post(
+                config.token_url,
+                data=data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+            response.raise_for_status()
 
-                return access_token
+            token_data = orjson.loads(response.content)
+            access_token = token_data.get("access_token")
 
-            except httpx.HTTPStatusError as e:
-                raise OAuthProviderError(
-                    provider=provider.value,
-                    detail=f"토큰 교환 실패: {e.response.status_code}",
-                )
-            except httpx.RequestError as e:
+            if not access_token:
                 raise OAuthProviderError(
                     provider=provider.value,
-                    detail=f"네트워크 오류: {str(e)}",
+                    detail="액세스 토큰을 받지 못했습니다.",
                 )
 
+            return access_token
+
+        except httpx.HTTPStatusError as e:
+            raise OAuthProviderError(
+                provider=provider.value,
+                detail=f"토큰 교환 실패: {e.response.status_code}",
+            )
+        except httpx.RequestError as e:
+            raise OAuthProviderError(
+                provider=provider.value,
+                detail=f"네트워크 오류: {str(e)}",
+            )
+
     async def _get_user_info(
         self, provider: OAuthProviderEnum, access_token: str,
     ) -> OAuthUserData:
         """OAuth 제공자로부터 사용자 정보 조회"""
         import httpx
+        import orjson
         from app.core.exceptions import OAuthProviderError
+        from app.infra.http import get_http_client
         from app.users.oauth_providers import OAuthProviders, parse_user_info
 
         config = OAuthProviders.get(provider)
         headers = {"Authorization": f"Bearer {access_token}"}
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    config.user_info_url,
-                    headers=headers,
-                    timeout=10.0,
-                )
-                response.raise_for_status()
+        client = get_http_client()
+        try:
+            response = await client.get(config.user_info_url, headers=headers)
+            response.raise_for_status()
 
-                raw_data = response.json()
-                parsed_data = parse_user_info(provider, raw_data)
+            raw_data = orjson.loads(response.content)
+            parsed_data = parse_user_info(provider, raw_data)
 
-                return OAuthUserData(
-                    provider=provider,
-                    provider_user_id=parsed_data["provider_user_id"],
-                    email=parsed_data.get("email", ""),
-                    name=parsed_data.get("name"),
-                    profile_image=parsed_data.get("profile_image"),
-                )
+            return OAuthUserData(
+                provider=provider,
+                provider_user_id=parsed_data["provider_user_id"],
+                email=parsed_data.get("email", ""),
+                name=parsed_data.get("name"),
+                profile_image=parsed_data.get("profile_image"),
+            )
 
-            except httpx.HTTPStatusError as e:
-                raise OAuthProviderError(
-                    provider=provider.value,
-                    detail=f"사용자 정보 조회 실패: {e.response.status_code}",
-                )
-            except httpx.RequestError as e:
-                raise OAuthProviderError(
-                    provider=provider.value,
-                    detail=f"네트워크 오류: {str(e)}",
-                )
+        except httpx.HTTPStatusError as e:
+            raise OAuthProviderError(
+                provider=provider.value,
+                detail=f"사용자 정보 조회 실패: {e.response.status_code}",
+            )
+        except httpx.RequestError as e:
+            raise OAuthProviderError(
+                provider=provider.value,
+                detail=f"네트워크 오류: {str(e)}",
+            )
 
     async def _find_or_create_user(
         self, oauth_data: OAuthUserData,
@@ -774,20 +836,18 @@ class OAuthService:
         """사용자 조회 또는 생성"""
         is_new_user = False
 
-        oauth_account = await self._get_oauth_account_by_provider_user_id(
-            oauth_data.provider, oauth_data.provider_user_id
+        # 이메일 정규화 (이메일 가입과 동일하게 소문자로 조회/저장)
+        email = oauth_data.email.lower()
+
+        user, oauth_account = await self._find_user_by_oauth_or_email(
+            oauth_data.provider, oauth_data.provider_user_id, email
         )
         if oauth_account:
-            user = await self._get_user_by_id(oauth_account.user_id)
             return user, oauth_account, is_new_user
 
-        user = None
-        if oauth_data.email:
-            user = await self._get_user_by_email(oauth_data.email)
-
         if not user:
             user = User(
-                email=oauth_data.email or f"{oauth_data.provider_user_id}@{oauth_data.provider.value}.oauth",
+                email=email or f"{oauth_data.provider_user_id}@{oauth_data.provider.value}.oauth",
                 password_hash=None,
                 status=UserStatus.ACTIVE,
             )
@@ -813,6 +873,48 @@ class OAuthService:
 
         return user, oauth_account, is_new_user
 
+    async def _find_user_by_oauth_or_email(
+        self, provider: OAuthProviderEnum, provider_user_id: str, email: str,
+    ) -> tuple[User | None, OAuthAccount | None]:
+        """OAuth 계정이 연결된 사용자 또는 이메일이 일치하는 사용자를 한 번의 쿼리로 조회
+
+        OAuth 계정이 연결된 사용자를 우선 반환하고, 없으면 이메일 일치 사용자를 반환합니다.
+        """
+        oauth_provider = OAuthProvider(provider.value)
+
+        # 비상관 스칼라 서브쿼리로 연결 사용자 ID를 한 번만 구해 users 인덱스 조회에 사용
+        linked_user_id = (
+            select(OAuthAccount.user_id)
+            .where(
+                OAuthAccount.provider == oauth_provider,
+                OAuthAccount.provider_user_id == provider_user_id,
+            )
+            .scalar_subquery()
+        )
+        condition = User.id == linked_user_id
+        if email:
+            condition = or_(condition, User.email == email)
+
+        result = await self.db.execute(
+            select(User, OAuthAccount)
+            .outerjoin(
+                OAuthAccount,
+                and_(
+                    OAuthAccount.user_id == User.id,
+                    OAuthAccount.provider == oauth_provider,
+                    OAuthAccount.provider_user_id == provider_user_id,
+                ),
+            )
+            .where(condition)
+        )
+
+        email_user = None
+        for user, oauth_account in result.all():
+            if oauth_account is not None:
+                return user, oauth_account
+            email_user = user
+        return email_user, None
+
     async def _get_oauth_account_by_provider_user_id(
         self, provider: OAuthProviderEnum, provider_user_id: str,
     ) -> OAuthAccount | None:
@@ -824,15 +926,3 @@ class OAuthService:
             )
         )
         return result.scalar_one_or_none()
-
-    async def _get_user_by_email(self, email: str) -> User | None:
-        """이메일로 사용자 조회"""
-        result = await self.db.execute(
-            select(User).where(User.email == email.lower())
-        )
-        return result.scalar_one_or_none()
-
-    async def _get_user_by_id(self, user_id: str) -> User | None:
-        """ID로 사용자 조회"""
-        result = await self.db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one_or_none()
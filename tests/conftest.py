@@ -4,22 +4,42 @@
 pytest-asyncio 기반 비동기 테스트 환경을 제공합니다.
 """
 
-from collections.abc import AsyncGenerator
+import os
+from collections.abc import AsyncGenerator, Generator
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
-    async_sessionmaker,
     create_async_engine,
 )
 
 from app.core.config import settings
-from app.infra.database import Base, get_db_session
+from app.core.dependencies import get_db
+from app.infra.database import Base
 from app.main import app
 
+# ==========================================================================
+# 보안 설정
+# ==========================================================================
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_bcrypt_rounds() -> Generator[None, None, None]:
+    """테스트 세션 동안 bcrypt cost를 최소값(4)으로 낮춤
+
+    테스트는 해시 강도를 검증하지 않으므로 해싱 비용만 줄입니다.
+    security 모듈은 해싱/재해싱 판단 시점에 settings.BCRYPT_ROUNDS를 읽으며,
+    세션 종료 시 원래 값으로 복원됩니다.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "BCRYPT_ROUNDS", 4)
+        yield
+
 
 # ==========================================================================
 # 데이터베이스 설정
@@ -35,56 +55,111 @@ def get_test_db_url() -> str:
         return base_url + "_test"
 
 
-@pytest_asyncio.fixture
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """테스트용 데이터베이스 세션 (각 테스트마다 독립 엔진)"""
+def get_test_schema() -> str | None:
+    """pytest-xdist 워커 전용 스키마 이름 (단일 프로세스 실행이면 None)
+
+    `pytest -n auto`로 실행하면 워커마다 별도 스키마에 테이블을 만들어
+    세션 범위 create_all/drop_all이 다른 워커의 테이블을 건드리지 않게 합니다.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    return f"test_{worker_id}" if worker_id else None
+
+
+@pytest_asyncio.fixture(scope="session")
+async def db_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """테스트용 데이터베이스 엔진 (테스트 세션 전체에서 1회 생성, 스키마도 1회 생성)"""
     test_db_url = get_test_db_url()
+    schema = get_test_schema()
 
     engine = create_async_engine(
         test_db_url,
         echo=False,
         pool_pre_ping=True,
+        # xdist 워커는 자기 스키마를 기본 검색 경로로 사용
+        connect_args={"server_settings": {"search_path": schema}} if schema else {},
     )
 
     # 테이블 생성
     async with engine.begin() as conn:
+        if schema:
+            await conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{schema}"'))
         await conn.run_sync(Base.metadata.create_all)
 
-    async_session = async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
-    async with async_session() as session:
-        yield session
-        await session.rollback()
+    yield engine
 
     # 테이블 삭제 및 정리
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+        if schema:
+            await conn.execute(text(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE'))
 
     await engine.dispose()
 
 
 @pytest_asyncio.fixture
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """테스트용 HTTP 클라이언트"""
+async def db_session(db_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """테스트용 데이터베이스 세션 (테스트마다 외부 트랜잭션 롤백으로 격리)
+
+    세션은 연결의 외부 트랜잭션에 참여하며, 테스트 코드의 commit()은
+    SAVEPOINT 해제로 처리되고 테스트 종료 시 외부 트랜잭션 전체를 롤백합니다.
+    """
+    async with db_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
+# 현재 테스트의 DB 세션 (세션 범위 HTTP 클라이언트의 의존성 오버라이드가 참조)
+# 테스트는 한 프로세스(xdist 워커 포함)에서 순차 실행되므로 모듈 전역 값으로 충분합니다.
+_current_db_session: AsyncSession | None = None
 
-    async def override_get_db():
-        yield db_session
 
-    app.dependency_overrides[get_db_session] = override_get_db
+async def _override_get_db() -> AsyncGenerator[AsyncSession, None]:
+    """DB 세션 의존성 오버라이드 (현재 테스트의 세션 반환)"""
+    assert _current_db_session is not None, "db_session 픽스처 없이 client를 사용할 수 없습니다."
+    yield _current_db_session
 
+
+@pytest_asyncio.fixture(scope="session")
+async def app_client() -> AsyncGenerator[AsyncClient, None]:
+    """테스트 세션 전체에서 공유하는 HTTP 클라이언트 (의존성 오버라이드 1회 설치)"""
+    app.dependency_overrides[get_db] = _override_get_db
+
+    # 요청은 ASGITransport로만 처리되므로 환경 변수의 프록시 설정을 읽지 않음
+    # (trust_env=True면 HTTP(S)_PROXY마다 연결 풀을 가진 전송 계층을 추가로 생성)
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
+        trust_env=False,
     ) as ac:
         yield ac
 
     app.dependency_overrides.clear()
 
 
+@pytest_asyncio.fixture
+async def client(
+    app_client: AsyncClient, db_session: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
+    """테스트용 HTTP 클라이언트 (요청은 현재 테스트의 DB 세션을 사용)"""
+    global _current_db_session
+
+    _current_db_session = db_session
+    try:
+        yield app_client
+    finally:
+        _current_db_session = None
+
+
 # ==========================================================================
 # 공통 유틸리티 픽스처
 # ==========================================================================
@@ -4,14 +4,12 @@ Cookbooks CRUD 통합 테스트
 레시피북 API 엔드포인트 통합 테스트
 """
 
-import pytest
 from httpx import AsyncClient
 
 from app.cookbooks.models import Cookbook
 from app.users.models import User
 
 
-@pytest.mark.asyncio
 class TestCreateCookbook:
     """레시피북 생성 (User Story 1) 통합 테스트"""
 
@@ -145,7 +143,6 @@ class TestCreateCookbook:
         assert data["sort_order"] == 1  # 기본 레시피북이 0
 
 
-@pytest.mark.asyncio
 class TestListCookbooks:
     """레시피북 목록 조회 (User Story 2) 통합 테스트"""
 
@@ -258,7 +255,6 @@ class TestListCookbooks:
         assert other_user_cookbook.id not in cookbook_ids
 
 
-@pytest.mark.asyncio
 class TestGetCookbook:
     """레시피북 상세 조회 (User Story 3) 통합 테스트"""
 
@@ -319,7 +315,6 @@ class TestGetCookbook:
         assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 class TestUpdateCookbook:
     """레시피북 수정 (User Story 4) 통합 테스트"""
 
@@ -406,7 +401,6 @@ class TestUpdateCookbook:
         assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 class TestDeleteCookbook:
     """레시피북 삭제 (User Story 5) 통합 테스트"""
 
@@ -482,7 +476,6 @@ class TestDeleteCookbook:
         assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 class TestReorderCookbooks:
     """레시피북 순서 변경 (User Story 6) 통합 테스트"""
 
@@ -17,7 +17,6 @@ from app.cookbooks.services import CookbookService
 from app.users.models import User
 
 
-@pytest.mark.asyncio
 class TestEnsureDefaultCookbook:
     """ensure_default_cookbook 테스트"""
 
@@ -59,7 +58,6 @@ class TestEnsureDefaultCookbook:
         assert cookbook.id == default_cookbook.id
 
 
-@pytest.mark.asyncio
 class TestCreateCookbook:
     """create_cookbook 테스트"""
 
@@ -125,7 +123,6 @@ class TestCreateCookbook:
         assert result2.sort_order == 2
 
 
-@pytest.mark.asyncio
 class TestGetCookbooks:
     """get_cookbooks 테스트"""
 
@@ -164,7 +161,6 @@ class TestGetCookbooks:
         assert result.items[0].is_default is True
 
 
-@pytest.mark.asyncio
 class TestGetCookbookById:
     """get_cookbook_by_id 테스트"""
 
@@ -216,7 +212,6 @@ class TestGetCookbookById:
             await service.get_cookbook_by_id(other_user_cookbook.id, user_id)
 
 
-@pytest.mark.asyncio
 class TestUpdateCookbook:
     """update_cookbook 테스트"""
 
@@ -276,7 +271,6 @@ class TestUpdateCookbook:
         assert result.is_default is True
 
 
-@pytest.mark.asyncio
 class TestDeleteCookbook:
     """delete_cookbook 테스트"""
 
@@ -327,7 +321,6 @@ class TestDeleteCookbook:
             )
 
 
-@pytest.mark.asyncio
 class TestReorderCookbooks:
     """reorder_cookbooks 테스트"""
 
@@ -4,7 +4,6 @@ SavedRecipe CRUD 통합 테스트 (SPEC-008)
 저장된 레시피 API 엔드포인트 통합 테스트
 """
 
-import pytest
 from httpx import AsyncClient
 
 from app.cookbooks.models import Cookbook, SavedRecipe
@@ -17,7 +16,6 @@ from app.users.models import User
 # ==========================================================================
 
 
-@pytest.mark.asyncio
 class TestSaveRecipe:
     """레시피 저장 (User Story 1) 통합 테스트"""
 
@@ -218,7 +216,6 @@ class TestSaveRecipe:
 # ==========================================================================
 
 
-@pytest.mark.asyncio
 class TestListSavedRecipes:
     """저장된 레시피 목록 조회 (User Story 2) 통합 테스트"""
 
@@ -351,7 +348,6 @@ class TestListSavedRecipes:
 # ==========================================================================
 
 
-@pytest.mark.asyncio
 class TestGetSavedRecipe:
     """저장된 레시피 상세 조회 (User Story 3) 통합 테스트"""
 
@@ -447,7 +443,6 @@ class TestGetSavedRecipe:
 # ==========================================================================
 
 
-@pytest.mark.asyncio
 class TestUpdateSavedRecipe:
     """저장된 레시피 수정 (User Story 4) 통합 테스트"""
 
@@ -569,7 +564,6 @@ class TestUpdateSavedRecipe:
 # ==========================================================================
 
 
-@pytest.mark.asyncio
 class TestDeleteSavedRecipe:
     """저장된 레시피 삭제 (User Story 5) 통합 테스트"""
 
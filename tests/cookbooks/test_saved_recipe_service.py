@@ -24,7 +24,6 @@ from app.users.models import User
 # ==========================================================================
 
 
-@pytest.mark.asyncio
 class TestSaveRecipe:
     """save_recipe 메서드 테스트 (T014)"""
 
@@ -134,7 +133,6 @@ class TestSaveRecipe:
 # ==========================================================================
 
 
-@pytest.mark.asyncio
 class TestListSavedRecipes:
     """list_saved_recipes 메서드 테스트"""
 
@@ -245,7 +243,6 @@ class TestListSavedRecipes:
 # ==========================================================================
 
 
-@pytest.mark.asyncio
 class TestGetSavedRecipe:
     """get_saved_recipe 메서드 테스트"""
 
@@ -336,7 +333,6 @@ class TestGetSavedRecipe:
 # ==========================================================================
 
 
-@pytest.mark.asyncio
 class TestUpdateSavedRecipe:
     """update_saved_recipe 메서드 테스트"""
 
@@ -430,7 +426,6 @@ class TestUpdateSavedRecipe:
 # ==========================================================================
 
 
-@pytest.mark.asyncio
 class TestDeleteSavedRecipe:
     """delete_saved_recipe 메서드 테스트"""
 
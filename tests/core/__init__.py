@@ -0,0 +1,3 @@
+"""
+Core 테스트 패키지
+"""
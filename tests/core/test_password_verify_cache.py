@@ -0,0 +1,133 @@
+"""
+비밀번호 검증 캐시 단위 테스트
+
+verify_password의 프로세스 내 검증 결과 캐시 동작을 검증합니다.
+"""
+
+import bcrypt
+import pytest
+
+from app.core import security
+from app.core.security import verify_password
+
+
+def _hash(password: str) -> str:
+    """테스트용 bcrypt 해시 (최소 cost)"""
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=4)).decode()
+
+
+@pytest.fixture(autouse=True)
+def clear_verify_cache():
+    """테스트마다 검증 캐시 초기화"""
+    security._verify_cache.clear()
+    yield
+    security._verify_cache.clear()
+
+
+@pytest.fixture
+def checkpw_calls(monkeypatch: pytest.MonkeyPatch) -> list[bytes]:
+    """bcrypt.checkpw 호출 기록 (실제 검증은 그대로 수행)"""
+    calls: list[bytes] = []
+    original = bcrypt.checkpw
+
+    def _counting_checkpw(password: bytes, hashed: bytes) -> bool:
+        calls.append(hashed)
+        return original(password, hashed)
+
+    monkeypatch.setattr(security.bcrypt, "checkpw", _counting_checkpw)
+    return calls
+
+
+class TestVerifyPasswordCache:
+    """verify_password 캐시 테스트"""
+
+    def test_cache_hit_skips_bcrypt(self, checkpw_calls: list[bytes]):
+        """같은 평문+해시 쌍의 두 번째 검증은 캐시에서 반환"""
+        # Given
+        hashed = _hash("password123")
+
+        # When
+        first = verify_password("password123", hashed)
+        second = verify_password("password123", hashed)
+
+        # Then
+        assert first is True
+        assert second is True
+        assert len(checkpw_calls) == 1
+
+    def test_failed_result_is_cached(self, checkpw_calls: list[bytes]):
+        """틀린 비밀번호 결과도 캐시 (반복 실패 시 bcrypt 생략)"""
+        # Given
+        hashed = _hash("password123")
+
+        # When
+        first = verify_password("wrong-password", hashed)
+        second = verify_password("wrong-password", hashed)
+
+        # Then
+        assert first is False
+        assert second is False
+        assert len(checkpw_calls) == 1
+
+    def test_cache_miss_for_different_password(self, checkpw_calls: list[bytes]):
+        """캐시된 실패가 올바른 비밀번호 검증에 영향을 주지 않음"""
+        # Given: 틀린 비밀번호 결과가 캐시된 상태
+        hashed = _hash("password123")
+        assert verify_password("wrong-password", hashed) is False
+
+        # When
+        result = verify_password("password123", hashed)
+
+        # Then
+        assert result is True
+        assert len(checkpw_calls) == 2
+
+    def test_evicts_oldest_entry_at_max_size(
+        self, monkeypatch: pytest.MonkeyPatch, checkpw_calls: list[bytes]
+    ):
+        """최대 크기 초과 시 가장 오래된 항목부터 제거"""
+        # Given: 최대 2개까지 캐시
+        monkeypatch.setattr(security, "_VERIFY_CACHE_MAX_SIZE", 2)
+        hashed = _hash("password123")
+        verify_password("first", hashed)
+        verify_password("second", hashed)
+        verify_password("third", hashed)
+
+        # When: 가장 오래된 항목과 최근 항목을 다시 검증
+        verify_password("first", hashed)
+        calls_before = len(checkpw_calls)
+        verify_password("third", hashed)
+
+        # Then
+        assert len(security._verify_cache) == 2
+        assert calls_before == 4  # first는 제거되어 다시 bcrypt 실행
+        assert len(checkpw_calls) == 4  # third는 캐시 적중
+
+    def test_rehashed_password_is_verified_again(self, checkpw_calls: list[bytes]):
+        """재해싱으로 해시가 바뀌면 이전 캐시를 쓰지 않고 새 해시로 검증"""
+        # Given: 이전 해시로 검증된 결과가 캐시된 상태
+        old_hash = _hash("password123")
+        assert verify_password("password123", old_hash) is True
+
+        # When: 같은 비밀번호를 새 salt로 재해싱
+        new_hash = _hash("password123")
+        result = verify_password("password123", new_hash)
+
+        # Then
+        assert result is True
+        assert checkpw_calls == [old_hash.encode(), new_hash.encode()]
+
+    def test_old_hash_result_not_reused_after_password_change(
+        self, checkpw_calls: list[bytes]
+    ):
+        """비밀번호 변경 후 이전 비밀번호는 새 해시에서 실패"""
+        # Given: 이전 비밀번호가 이전 해시로 성공한 결과가 캐시된 상태
+        old_hash = _hash("old-password1")
+        assert verify_password("old-password1", old_hash) is True
+
+        # When: 새 비밀번호 해시로 이전 비밀번호 검증
+        new_hash = _hash("new-password1")
+        result = verify_password("old-password1", new_hash)
+
+        # Then
+        assert result is False
@@ -0,0 +1,111 @@
+"""
+JWT 디코드 캐시 단위 테스트
+
+decode_token의 검증된 페이로드 캐시 동작을 검증합니다.
+"""
+
+import base64
+import json
+import time
+from datetime import timedelta
+
+import pytest
+
+from app.core import security
+from app.core.security import create_access_token, decode_token
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """테스트마다 토큰 캐시 초기화"""
+    security._token_cache.clear()
+    yield
+    security._token_cache.clear()
+
+
+def _tamper_payload(token: str, **claims: str) -> str:
+    """서명은 그대로 두고 페이로드 클레임만 바꾼 토큰 생성"""
+    header, payload, signature = token.split(".")
+    padded = payload + "=" * (-len(payload) % 4)
+    data = json.loads(base64.urlsafe_b64decode(padded))
+    data.update(claims)
+    new_payload = (
+        base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+    )
+    return f"{header}.{new_payload}.{signature}"
+
+
+class TestDecodeTokenCache:
+    """decode_token 캐시 테스트"""
+
+    def test_valid_token_is_cached(self):
+        """검증된 토큰은 캐시에 저장되고 같은 페이로드 반환"""
+        # Given
+        token = create_access_token(subject="user-1")
+
+        # When
+        first = decode_token(token)
+        second = decode_token(token)
+
+        # Then
+        assert token in security._token_cache
+        assert first == second
+        assert second["sub"] == "user-1"
+
+    def test_expired_entry_is_dropped(self):
+        """exp가 지난 캐시 항목은 제거되고 만료 토큰으로 거부"""
+        # Given: 1초 뒤 만료되는 토큰이 캐시된 상태
+        token = create_access_token(subject="user-1", expires_delta=timedelta(seconds=1))
+        assert decode_token(token) is not None
+        assert token in security._token_cache
+
+        # When
+        time.sleep(2)
+        result = decode_token(token)
+
+        # Then
+        assert result is None
+        assert token not in security._token_cache
+
+    def test_tampered_token_not_served_from_cache(self):
+        """원본 토큰이 캐시되어 있어도 페이로드를 바꾼 토큰은 거부"""
+        # Given: 원본 토큰이 캐시된 상태
+        token = create_access_token(subject="user-1")
+        assert decode_token(token) is not None
+
+        # When
+        tampered = _tamper_payload(token, sub="attacker")
+        result = decode_token(tampered)
+
+        # Then
+        assert result is None
+        assert tampered not in security._token_cache
+
+    def test_tampered_signature_rejected(self):
+        """서명을 바꾼 토큰은 거부되고 캐시되지 않음"""
+        # Given
+        token = create_access_token(subject="user-1")
+        assert decode_token(token) is not None
+        header, payload, signature = token.split(".")
+        forged = f"{header}.{payload}.{signature[::-1]}"
+
+        # When
+        result = decode_token(forged)
+
+        # Then
+        assert result is None
+        assert forged not in security._token_cache
+
+    def test_returned_payload_is_a_copy(self):
+        """반환된 페이로드를 수정해도 캐시된 값은 바뀌지 않음"""
+        # Given
+        token = create_access_token(subject="user-1")
+
+        # When: 캐시 미스와 캐시 적중 결과를 각각 수정
+        missed = decode_token(token)
+        missed["sub"] = "mutated-on-miss"
+        hit = decode_token(token)
+        hit["sub"] = "mutated-on-hit"
+
+        # Then
+        assert decode_token(token)["sub"] == "user-1"
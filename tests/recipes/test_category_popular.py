@@ -4,13 +4,11 @@
 GET /api/v1/recipes/{recipe_id}/category-popular 엔드포인트 테스트
 """
 
-import pytest
 from httpx import AsyncClient
 
 from app.recipes.models import Recipe
 
 
-@pytest.mark.asyncio
 class TestCategoryPopularAPI:
     """카테고리 인기 레시피 API 통합 테스트"""
 
@@ -12,7 +12,7 @@ from httpx import AsyncClient
 from app.recipes.models import Recipe
 
 
-@pytest.mark.asyncio
+@pytest.mark.slow
 class TestSimilarRecipesPerformance:
     """유사 레시피 API 성능 테스트"""
 
@@ -159,7 +159,7 @@ class TestSimilarRecipesPerformance:
         )
 
 
-@pytest.mark.asyncio
+@pytest.mark.slow
 class TestPaginationPerformance:
     """페이지네이션 성능 테스트"""
 
@@ -4,13 +4,11 @@
 GET /api/v1/recipes/{recipe_id}/related-by-tags 엔드포인트 테스트
 """
 
-import pytest
 from httpx import AsyncClient
 
 from app.recipes.models import Recipe
 
 
-@pytest.mark.asyncio
 class TestRelatedByTagsAPI:
     """태그 기반 관련 레시피 API 통합 테스트"""
 
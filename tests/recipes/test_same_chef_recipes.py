@@ -4,13 +4,11 @@
 GET /api/v1/recipes/{recipe_id}/same-chef 엔드포인트 테스트
 """
 
-import pytest
 from httpx import AsyncClient
 
 from app.recipes.models import Chef, Recipe
 
 
-@pytest.mark.asyncio
 class TestSameChefRecipesAPI:
     """같은 요리사 레시피 API 통합 테스트"""
 
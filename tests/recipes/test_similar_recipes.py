@@ -4,13 +4,11 @@
 GET /api/v1/recipes/{recipe_id}/similar 엔드포인트 테스트
 """
 
-import pytest
 from httpx import AsyncClient
 
 from app.recipes.models import Recipe
 
 
-@pytest.mark.asyncio
 class TestSimilarRecipesAPI:
     """유사 레시피 API 통합 테스트"""
 
@@ -216,7 +214,6 @@ class TestSimilarRecipesAPI:
         assert response.status_code in [200, 400]
 
 
-@pytest.mark.asyncio
 class TestSimilarRecipesSimilarityCalculation:
     """유사도 계산 로직 테스트"""
 
@@ -11,7 +11,6 @@ from app.recipes.models import Recipe
 from app.recipes.services import SimilarRecipeService
 
 
-@pytest.mark.asyncio
 class TestSimilarRecipeServiceGetSimilar:
     """get_similar_recipes 메서드 테스트"""
 
@@ -158,7 +157,6 @@ class TestSimilarRecipeServiceGetSimilar:
         assert hasattr(result, "items")
 
 
-@pytest.mark.asyncio
 class TestSimilarityCalculation:
     """유사도 계산 로직 테스트"""
 
@@ -207,7 +205,6 @@ class TestSimilarityCalculation:
             assert item.similarity_score <= 1.0
 
 
-@pytest.mark.asyncio
 class TestSimilarRecipesResponseSchema:
     """응답 스키마 테스트"""
 
@@ -268,7 +265,6 @@ class TestSimilarRecipesResponseSchema:
             assert isinstance(item.tags, list)
 
 
-@pytest.mark.asyncio
 class TestSimilarRecipesCaching:
     """Redis 캐싱 테스트"""
 
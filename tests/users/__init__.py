@@ -0,0 +1,3 @@
+"""
+Users 테스트 패키지
+"""
@@ -0,0 +1,71 @@
+"""
+Users 테스트 픽스처
+
+프로필, 취향 설정, 옵션 조회 테스트용 공통 픽스처를 제공합니다.
+"""
+
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import create_access_token
+from app.users.models import TastePreference, User, UserProfile
+
+
+@pytest.fixture
+def user_id() -> str:
+    """테스트용 사용자 ID"""
+    return str(uuid4())
+
+
+@pytest_asyncio.fixture
+async def test_user(db_session: AsyncSession, user_id: str) -> User:
+    """테스트용 사용자 (프로필 없음)"""
+    user = User(
+        id=user_id,
+        email="test@example.com",
+    )
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+@pytest_asyncio.fixture
+async def test_profile(
+    db_session: AsyncSession, test_user: User, user_id: str
+) -> UserProfile:
+    """테스트용 사용자 프로필"""
+    profile = UserProfile(
+        user_id=user_id,
+        display_name="테스트 사용자",
+    )
+    db_session.add(profile)
+    await db_session.flush()
+    return profile
+
+
+@pytest.fixture
+def auth_headers(user_id: str) -> dict[str, str]:
+    """인증된 사용자 헤더"""
+    token = create_access_token(subject=user_id)
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest_asyncio.fixture
+async def overall_taste(
+    db_session: AsyncSession, test_profile: UserProfile, user_id: str
+) -> TastePreference:
+    """기존 overall 맛 취향"""
+    pref = TastePreference(
+        user_id=user_id,
+        category="overall",
+        sweetness=2,
+        saltiness=1,
+        spiciness=3,
+        sourness=3,
+    )
+    db_session.add(pref)
+    await db_session.flush()
+    return pref
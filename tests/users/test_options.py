@@ -0,0 +1,135 @@
+"""
+옵션 조회 API 통합 테스트
+
+식이 제한/알레르기/요리 카테고리 옵션 목록과 ETag 조건부 요청을 검증합니다.
+"""
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from httpx import AsyncClient
+
+from app.users.schemas import (
+    ALLERGY_LABELS,
+    CUISINE_CATEGORY_LABELS,
+    DIETARY_RESTRICTION_LABELS,
+    OptionItem,
+    OptionsResponse,
+)
+
+# (엔드포인트, 옵션 라벨 매핑)
+OPTION_ENDPOINTS = [
+    ("/api/v1/users/me/preferences/dietary-options", DIETARY_RESTRICTION_LABELS),
+    ("/api/v1/users/me/preferences/allergy-options", ALLERGY_LABELS),
+    ("/api/v1/users/me/preferences/cuisine-options", CUISINE_CATEGORY_LABELS),
+]
+
+
+@pytest.mark.parametrize(("url", "labels"), OPTION_ENDPOINTS)
+class TestOptionsAPI:
+    """옵션 목록 조회 및 조건부 요청 테스트"""
+
+    async def test_body_matches_response_model_serialization(
+        self, client: AsyncClient, url: str, labels: dict
+    ):
+        """200 본문이 response_model 직렬화 결과(기존 응답)와 동일"""
+        # Given: FastAPI가 OptionsResponse를 직렬화하던 결과
+        expected = jsonable_encoder(
+            OptionsResponse(
+                success=True,
+                data=[
+                    OptionItem(value=option.value, label=label)
+                    for option, label in labels.items()
+                ],
+            )
+        )
+
+        # When
+        response = await client.get(url)
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == expected
+
+    async def test_response_has_etag(
+        self, client: AsyncClient, url: str, labels: dict
+    ):
+        """200 응답에 강한 ETag 포함"""
+        # When
+        response = await client.get(url)
+
+        # Then
+        etag = response.headers["etag"]
+        assert etag.startswith('"') and etag.endswith('"')
+
+    async def test_matching_etag_returns_304(
+        self, client: AsyncClient, url: str, labels: dict
+    ):
+        """ETag 일치 시 본문 없이 304, ETag 헤더 유지"""
+        # Given
+        etag = (await client.get(url)).headers["etag"]
+
+        # When
+        response = await client.get(url, headers={"If-None-Match": etag})
+
+        # Then
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    async def test_weak_etag_returns_304(
+        self, client: AsyncClient, url: str, labels: dict
+    ):
+        """W/ 접두사가 붙은 약한 검증자도 일치로 처리"""
+        # Given
+        etag = (await client.get(url)).headers["etag"]
+
+        # When
+        response = await client.get(url, headers={"If-None-Match": f"W/{etag}"})
+
+        # Then
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+    async def test_etag_in_list_returns_304(
+        self, client: AsyncClient, url: str, labels: dict
+    ):
+        """쉼표로 구분된 목록 중 하나라도 일치하면 304"""
+        # Given
+        etag = (await client.get(url)).headers["etag"]
+
+        # When
+        response = await client.get(
+            url, headers={"If-None-Match": f'"stale", W/"other",  {etag}'}
+        )
+
+        # Then
+        assert response.status_code == 304
+
+    async def test_wildcard_returns_304(
+        self, client: AsyncClient, url: str, labels: dict
+    ):
+        """If-None-Match: * 는 항상 일치"""
+        # When
+        response = await client.get(url, headers={"If-None-Match": "*"})
+
+        # Then
+        assert response.status_code == 304
+        assert response.content == b""
+
+    async def test_mismatched_etag_returns_full_body(
+        self, client: AsyncClient, url: str, labels: dict
+    ):
+        """ETag 불일치 시 200과 전체 본문"""
+        # Given
+        first = await client.get(url)
+
+        # When
+        response = await client.get(
+            url, headers={"If-None-Match": '"stale", W/"other"'}
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.content == first.content
+        assert response.headers["etag"] == first.headers["etag"]
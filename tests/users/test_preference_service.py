@@ -0,0 +1,91 @@
+"""
+PreferenceService 단위 테스트
+
+서비스 레이어 비즈니스 로직 테스트
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.users.models import TastePreference, UserProfile
+from app.users.schemas import PreferencesUpdateRequest, TastePreferenceData
+from app.users.services import PreferenceService
+
+
+def _taste_values(
+    pref: TastePreference | TastePreferenceData,
+) -> tuple[int, int, int, int]:
+    """맛 취향 값 튜플 (단맛, 짠맛, 매운맛, 신맛)"""
+    return (pref.sweetness, pref.saltiness, pref.spiciness, pref.sourness)
+
+
+class TestUpdateTastePreferences:
+    """update_preferences 맛 취향 upsert 테스트"""
+
+    async def test_updates_existing_and_inserts_new_category(
+        self,
+        db_session: AsyncSession,
+        test_profile: UserProfile,
+        overall_taste: TastePreference,
+        user_id: str,
+    ):
+        """기존 카테고리 수정과 새 카테고리 추가를 한 번에 반영"""
+        # Given: overall(2, 1, 3, 3)이 저장된 상태
+        service = PreferenceService(db_session)
+        request = PreferencesUpdateRequest(
+            tastePreferences={
+                "overall": {"sweetness": 4},
+                "korean": {"spiciness": 5},
+            }
+        )
+
+        # When
+        result = await service.update_preferences(user_id, request)
+
+        # Then: 응답 데이터
+        # overall: 요청 값만 바뀌고 나머지는 기존 값 유지
+        # korean: 요청 값 → overall 요청 값 상속 → 기본값(3)
+        assert result is not None
+        assert _taste_values(result.taste_preferences["overall"]) == (4, 1, 3, 3)
+        assert _taste_values(result.taste_preferences["korean"]) == (4, 3, 5, 3)
+
+        # Then: 저장된 행 (기존 행은 같은 id로 수정, 새 카테고리는 추가)
+        db_session.expire_all()
+        rows = {
+            pref.category: pref
+            for pref in (
+                await db_session.scalars(
+                    select(TastePreference).where(TastePreference.user_id == user_id)
+                )
+            )
+        }
+        assert set(rows) == {"overall", "korean"}
+        assert rows["overall"].id == overall_taste.id
+        assert _taste_values(rows["overall"]) == (4, 1, 3, 3)
+        assert _taste_values(rows["korean"]) == (4, 3, 5, 3)
+
+    async def test_returned_data_matches_get_preferences(
+        self,
+        db_session: AsyncSession,
+        test_profile: UserProfile,
+        overall_taste: TastePreference,
+        user_id: str,
+    ):
+        """수정 응답이 이후 조회 결과와 동일"""
+        # Given
+        service = PreferenceService(db_session)
+        request = PreferencesUpdateRequest(
+            tastePreferences={
+                "overall": {"saltiness": 2},
+                "japanese": {"sourness": 1},
+            }
+        )
+
+        # When
+        updated = await service.update_preferences(user_id, request)
+        db_session.expire_all()
+        fetched = await service.get_preferences(user_id)
+
+        # Then
+        assert updated is not None and fetched is not None
+        assert updated.taste_preferences == fetched.taste_preferences
@@ -0,0 +1,79 @@
+"""
+ProfileService 단위 테스트
+
+서비스 레이어 비즈니스 로직 테스트
+"""
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.users.models import User, UserProfile
+from app.users.services import ProfileService
+
+
+class TestEnsureProfileExists:
+    """ensure_profile_exists 테스트"""
+
+    async def test_creates_profile_if_none_exists(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        user_id: str,
+    ):
+        """프로필이 없으면 기본 프로필 생성"""
+        # Given: 프로필이 없는 사용자
+        service = ProfileService(db_session)
+
+        # When
+        profile = await service.ensure_profile_exists(user_id)
+
+        # Then
+        assert profile.user_id == user_id
+        assert profile.display_name == ""
+
+    async def test_returns_existing_profile(
+        self,
+        db_session: AsyncSession,
+        test_profile: UserProfile,
+        user_id: str,
+    ):
+        """프로필이 있으면 새로 만들지 않고 기존 프로필 반환"""
+        # Given
+        service = ProfileService(db_session)
+
+        # When
+        profile = await service.ensure_profile_exists(user_id)
+
+        # Then
+        assert profile.id == test_profile.id
+        count = await db_session.scalar(
+            select(func.count())
+            .select_from(UserProfile)
+            .where(UserProfile.user_id == user_id)
+        )
+        assert count == 1
+
+    async def test_recreates_profile_after_deletion(
+        self,
+        db_session: AsyncSession,
+        test_profile: UserProfile,
+        user_id: str,
+    ):
+        """한 번 확인된 프로필이 삭제되면 다음 호출에서 다시 생성"""
+        # Given: 존재가 확인된 뒤 삭제된 프로필
+        service = ProfileService(db_session)
+        await service.ensure_profile_exists(user_id)
+        deleted_id = test_profile.id
+        await db_session.delete(test_profile)
+        await db_session.flush()
+
+        # When
+        profile = await service.ensure_profile_exists(user_id)
+
+        # Then
+        assert profile.id != deleted_id
+        assert profile.user_id == user_id
+        persisted = await db_session.scalar(
+            select(UserProfile.id).where(UserProfile.user_id == user_id)
+        )
+        assert persisted == profile.id